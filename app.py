@@ -99,10 +99,10 @@ def handle_report_generation(config: Config, report_type: str, year: int, max_wo
             if result:
                 csv_path, xlsx_path = result
                 if csv_path and Path(csv_path).exists():
-                    # Store in session state
+                    # Store in session state as Path objects, converted once here
                     st.session_state.report_generated = True
-                    st.session_state.csv_path = csv_path
-                    st.session_state.xlsx_path = xlsx_path
+                    st.session_state.csv_path = Path(csv_path)
+                    st.session_state.xlsx_path = Path(xlsx_path) if xlsx_path else None
                     st.session_state.report_type = report_type
                     
                     # Read CSV data
@@ -133,7 +133,6 @@ def load_and_validate_config(use_cache: bool, max_workers: int):
         if not Path(config.jira.cache_dir).is_absolute():
             config.jira.cache_dir = str(Path.cwd() / config.jira.cache_dir)
         
-        config.validate()
         return config
         
     except ValueError as e:
@@ -0,0 +1,3 @@
+"""
+Command-line scripts for Automate Jira
+"""
@@ -104,9 +104,8 @@ Examples:
     setup_logging(level=log_level, verbose=args.verbose)
     
     try:
-        # Load configuration
+        # Load configuration (JiraConfig validates itself on construction)
         config = Config.from_env()
-        config.validate()
         
         # Generate report based on type
         if args.weekly:
@@ -28,13 +28,15 @@ setup(
     author="Your Team",
     author_email="your-email@company.com",
     url="https://github.com/yourcompany/automate-jira",
-    packages=find_packages(include=["src", "src.*"]),
+    packages=find_packages(include=["src", "src.*", "scripts"]),
     install_requires=requirements,
     extras_require={
         "dev": [
             "pytest>=7.4.0",
             "pytest-cov>=4.1.0",
+            "coverage>=7.4.0",
             "pytest-mock>=3.11.0",
+            "pytest-xdist>=3.5.0",
             "responses>=0.23.0",
             "black>=23.0.0",
             "flake8>=6.0.0",
@@ -50,15 +52,13 @@ setup(
             "jira-tracker=scripts.generate_report:main",
         ],
     },
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
         "Topic :: Software Development :: Bug Tracking",
         "License :: OSI Approved :: MIT License",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
     ],
@@ -28,7 +28,9 @@ class JiraConfig:
     project_keys: Optional[List[str]] = None  # None means fetch all projects
     enable_cache: bool = True
     cache_dir: str = ".cache"
-    max_workers: int = 8  # For parallel processing
+    max_workers: Optional[int] = None  # For parallel processing (None means size from CPU count)
+    page_size: int = 100  # maxResults per paginated request (Jira Cloud returns at most 100 issues per search page)
+    requests_per_sec: float = 10.0  # Shared API rate limit across worker threads (0 disables)
     
     @classmethod
     def from_env(cls) -> "JiraConfig":
@@ -54,7 +56,10 @@ class JiraConfig:
         # Performance settings
         enable_cache = os.getenv('JIRA_ENABLE_CACHE', 'true').lower() in ('true', '1', 'yes')
         cache_dir = os.getenv('JIRA_CACHE_DIR', '.cache')
-        max_workers = int(os.getenv('JIRA_MAX_WORKERS', '8'))
+        max_workers_str = os.getenv('JIRA_MAX_WORKERS', '')
+        max_workers = int(max_workers_str) if max_workers_str else None
+        page_size = int(os.getenv('JIRA_PAGE_SIZE', '100'))
+        requests_per_sec = float(os.getenv('JIRA_REQUESTS_PER_SEC', '10'))
         
         return cls(
             url=url.rstrip('/'),
@@ -63,11 +68,16 @@ class JiraConfig:
             project_keys=project_keys,
             enable_cache=enable_cache,
             cache_dir=cache_dir,
-            max_workers=max_workers
+            max_workers=max_workers,
+            page_size=page_size,
+            requests_per_sec=requests_per_sec
         )
     
-    def validate(self) -> bool:
-        """Validate configuration"""
+    def __post_init__(self):
+        self.validate()
+    
+    def validate(self) -> None:
+        """Validate configuration, raising ValueError on the first invalid field"""
         if not self.url.startswith(('http://', 'https://')):
             raise ValueError(f"Invalid JIRA_URL: {self.url}")
         
@@ -78,8 +88,6 @@ class JiraConfig:
             raise ValueError("Invalid JIRA_API_TOKEN")
         
         # project_keys can be None (fetch all projects)
-        
-        return True
 
 
 @dataclass
@@ -144,6 +152,6 @@ class Config:
             export=ExportConfig()
         )
     
-    def validate(self) -> bool:
-        """Validate all configuration"""
-        return self.jira.validate()
+    def validate(self) -> None:
+        """Validate all configuration, raising ValueError if anything is invalid"""
+        self.jira.validate()
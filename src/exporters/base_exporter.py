@@ -2,9 +2,12 @@
 Base exporter class for all export formats
 """
 
+import csv
+import io
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO, Union
 
 from ..models import YearlyReport, MonthlyReport
 
@@ -12,7 +15,7 @@ from ..models import YearlyReport, MonthlyReport
 class BaseExporter(ABC):
     """Abstract base class for exporters"""
     
-    def __init__(self, output_path: Path):
+    def __init__(self, output_path: Union[Path, TextIO]):
         self.output_path = output_path
     
     @abstractmethod
@@ -25,9 +28,30 @@ class BaseExporter(ABC):
         """Export monthly report"""
         pass
     
+    def _writes_to_file_object(self) -> bool:
+        """Check whether output goes to an open text file object rather than a path"""
+        return hasattr(self.output_path, 'write')
+    
     def _ensure_directory(self):
         """Ensure output directory exists"""
-        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        if not self._writes_to_file_object():
+            self.output_path.parent.mkdir(parents=True, exist_ok=True)
+    
+    @contextmanager
+    def _csv_writer(self):
+        """Yield a CSV writer whose rows are written to the output file in a single call
+        
+        Rows are buffered in memory, so the file is only created once the whole
+        report has been built. A file object given as output_path is written
+        to directly.
+        """
+        buffer = io.StringIO(newline='')
+        yield csv.writer(buffer)
+        if self._writes_to_file_object():
+            self.output_path.write(buffer.getvalue())
+            return
+        with open(self.output_path, 'w', newline='', encoding='utf-8') as f:
+            f.write(buffer.getvalue())
     
     def _write_metadata_header(self, writer, report):
         """Write metadata header with timestamp information to CSV
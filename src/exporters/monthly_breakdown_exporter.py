@@ -2,7 +2,6 @@
 Monthly breakdown exporter (CSV and XLSX formats) - one sheet per team member
 """
 
-import csv
 import logging
 from pathlib import Path
 from collections import defaultdict
@@ -83,9 +82,7 @@ class MonthlyBreakdownExporter(BaseExporter):
         
         month_names = [month_name[i][:3] for i in range(1, 13)]
         
-        with open(self.output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
+        with self._csv_writer() as writer:
             # Write metadata header
             if report:
                 self._write_metadata_header(writer, report)
@@ -2,7 +2,6 @@
 Quarterly breakdown exporter (CSV and XLSX formats)
 """
 
-import csv
 import logging
 from pathlib import Path
 from collections import defaultdict
@@ -70,9 +69,7 @@ class QuarterlyBreakdownExporter(BaseExporter):
         sorted_authors = sorted(all_authors, key=lambda a: a.display_name)
         
         # Write CSV with separate sections
-        with open(self.output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
+        with self._csv_writer() as writer:
             # Write metadata header
             self._write_metadata_header(writer, report)
             
@@ -2,7 +2,6 @@
 Weekly breakdown exporter (CSV and XLSX formats) - one sheet per team member
 """
 
-import csv
 import logging
 from pathlib import Path
 from collections import defaultdict
@@ -97,9 +96,7 @@ class WeeklyBreakdownExporter(BaseExporter):
             for week in range(1, 6):
                 week_headers.append(f"{month_abbr}W{week}")
         
-        with open(self.output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
+        with self._csv_writer() as writer:
             # Write metadata header
             if report:
                 self._write_metadata_header(writer, report)
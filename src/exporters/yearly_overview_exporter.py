@@ -2,10 +2,10 @@
 Yearly overview CSV exporter for multi-user reports
 """
 
-import csv
 import logging
 from pathlib import Path
 from collections import defaultdict
+from typing import TextIO, Union
 
 from .base_exporter import BaseExporter
 from ..models import YearlyReport, MonthlyReport, ProjectComponent
@@ -16,8 +16,12 @@ logger = logging.getLogger(__name__)
 class YearlyOverviewExporter(BaseExporter):
     """Export yearly overview reports to CSV format"""
     
-    def __init__(self, output_path: Path, filter_active_only: bool = True):
-        """Initialize exporter with option to filter active employees only"""
+    def __init__(self, output_path: Union[Path, TextIO], filter_active_only: bool = True):
+        """Initialize exporter with option to filter active employees only
+        
+        output_path may also be an open text file object (e.g. io.StringIO),
+        which receives the CSV text instead of a file on disk.
+        """
         super().__init__(output_path)
         self.filter_active_only = filter_active_only
     
@@ -59,9 +63,7 @@ class YearlyOverviewExporter(BaseExporter):
         sorted_authors = sorted(all_authors, key=lambda a: a.display_name)
         
         # Write CSV with separate sections
-        with open(self.output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
+        with self._csv_writer() as writer:
             # Write metadata header
             self._write_metadata_header(writer, report)
             
@@ -138,9 +140,7 @@ class YearlyOverviewExporter(BaseExporter):
         sorted_authors = sorted(all_authors, key=lambda a: a.display_name)
         
         # Write CSV
-        with open(self.output_path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            
+        with self._csv_writer() as writer:
             # Header
             header = ['Project', 'Component'] + [a.display_name for a in sorted_authors]
             writer.writerow(header)
@@ -3,21 +3,31 @@ Jira API client for fetching worklog data
 """
 
 import logging
-from typing import List, Dict, Optional, Any
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Optional
 from datetime import datetime, timezone, timedelta
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 import json
 import hashlib
+import threading
+import time
 from pathlib import Path
 
 from .config import JiraConfig
-from .models import Issue, Worklog, Component, Author, WorkType
-from .utils.date_utils import MALAYSIA_TZ
+from .models import Issue, Worklog, Component, Author, WorkType, WorklogTable
+from .utils.date_utils import MALAYSIA_TZ, get_year_range, format_date_for_jql, parse_jira_datetime
 
 logger = logging.getLogger(__name__)
 
 
+# Connection pool size when max_workers is not configured (matches the default worker cap)
+DEFAULT_POOL_SIZE = 32
+
+
 class JiraClientError(Exception):
     """Base exception for Jira client errors"""
     pass
@@ -33,33 +43,98 @@ class JiraAPIError(JiraClientError):
     pass
 
 
+class RateLimiter:
+    """Thread-safe token bucket shared by all threads making API requests"""
+    
+    def __init__(self, requests_per_sec: float, burst: Optional[float] = None):
+        self.rate = requests_per_sec
+        self.capacity = burst or max(requests_per_sec, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a request token is available"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
 class JiraClient:
     """Client for interacting with Jira API"""
     
-    def __init__(self, config: JiraConfig, enable_cache: bool = True, cache_dir: str = ".cache"):
+    def __init__(
+        self,
+        config: JiraConfig,
+        enable_cache: bool = True,
+        cache_dir: str = ".cache",
+        rate_limiter: Optional[RateLimiter] = None
+    ):
         self.config = config
+        # One limiter per client; the client is shared by all fetch threads
+        if rate_limiter is None and config.requests_per_sec > 0:
+            rate_limiter = RateLimiter(config.requests_per_sec)
+        self.rate_limiter = rate_limiter
         self.session = requests.Session()
         self.session.auth = HTTPBasicAuth(config.username, config.api_token)
+        # The session is shared by all fetch threads; size the pool so no worker
+        # has to open a fresh connection, and retry transient failures in place
+        pool_size = max(config.max_workers or 0, DEFAULT_POOL_SIZE)
+        adapter = HTTPAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=[429, 502, 503, 504],
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Callers fan out per project and get_issues_with_worklog fans out per
+        # page, so cap in-flight requests at the pool size across all threads
+        # and share one page executor instead of nesting a pool per search
+        self._request_slots = threading.BoundedSemaphore(pool_size)
+        self._page_executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="jira-page")
         self.base_url = f"{config.url}/rest/api/3"
         self.enable_cache = enable_cache
         self.cache_dir = Path(cache_dir)
         self.cache_hit_count = 0
         self.cache_miss_count = 0
+        # Authors (keyed on every field of the raw author payload) and components
+        # resolved by this client; scoped to it so nothing outlives one report run
+        self._author_pool: Dict[tuple, Author] = {}
+        self._component_pool: Dict[tuple, Component] = {}
         if enable_cache:
             self.cache_dir.mkdir(exist_ok=True)
     
     def get_cache_timestamp(self) -> Optional[datetime]:
         """Get the oldest cache file timestamp in Malaysia time"""
-        if not self.enable_cache or not self.cache_dir.exists():
+        if not self.enable_cache:
             return None
         
-        cache_files = list(self.cache_dir.glob("*.json"))
-        if not cache_files:
+        # One directory scan; a missing cache dir simply means no timestamp
+        try:
+            with os.scandir(self.cache_dir) as entries:
+                mtimes = [
+                    entry.stat().st_mtime for entry in entries
+                    if entry.name.endswith('.json') and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return None
+        if not mtimes:
             return None
         
         # Get the oldest cache file timestamp and convert to Malaysia time
-        oldest_time = min(f.stat().st_mtime for f in cache_files)
-        return datetime.fromtimestamp(oldest_time, tz=MALAYSIA_TZ)
+        return datetime.fromtimestamp(min(mtimes), tz=MALAYSIA_TZ)
     
     def is_using_cache(self) -> bool:
         """Check if any cache was used in this session"""
@@ -117,8 +192,11 @@ class JiraClient:
         url = f"{self.base_url}/{endpoint}"
         
         try:
+            if self.rate_limiter:
+                self.rate_limiter.acquire()
             logger.debug(f"Making {method} request to {url}")
-            response = self.session.request(method, url, params=params)
+            with self._request_slots:
+                response = self.session.request(method, url, params=params)
             response.raise_for_status()
             data = response.json()
             
@@ -153,16 +231,15 @@ class JiraClient:
             logger.warning(f"Failed to fetch user details for {account_id}: {e}")
             return {}
     
-    def get_issues_with_worklog(
+    def _build_worklog_search_params(
         self,
         project_key: str,
         start_date: str,
         end_date: str,
-        filter_user: Optional[str] = None
-    ) -> List[Dict]:
-        """Fetch issues with worklog data"""
-        
-        # Build JQL query
+        filter_user: Optional[str] = None,
+        page_size: Optional[int] = None
+    ) -> Dict:
+        """Build JQL search params for issues with worklogs in a date range"""
         jql_parts = [
             f'project = {project_key}',
             f'worklogDate >= "{start_date}"',
@@ -172,34 +249,132 @@ class JiraClient:
         if filter_user:
             jql_parts.append(f'worklogAuthor = "{filter_user}"')
         
-        jql = ' AND '.join(jql_parts)
-        
-        params = {
-            'jql': jql,
+        return {
+            'jql': ' AND '.join(jql_parts),
             'fields': 'key,summary,components,labels,issuetype,worklog,customfield_*',
             'expand': 'worklog',
-            'maxResults': 1000  # Increased from 100 to 1000 for better performance
+            'maxResults': page_size or self.config.page_size
         }
-        
-        issues = []
+    
+    def _load_cached(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Dict]:
+        """Read a cached response without counting a cache hit, or None if it is missing"""
+        cache_file = self.cache_dir / f"{self._get_cache_key(endpoint, params)}.json"
+        try:
+            with open(cache_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def _cached_worklogs(self, issue_key: str) -> Optional[List[Dict]]:
+        """Replay get_all_worklogs_for_issue from the cache, or None if a page is missing"""
+        worklogs = []
         start_at = 0
+        while True:
+            response = self._load_cached(
+                f"issue/{issue_key}/worklog",
+                {'startAt': start_at, 'maxResults': self.config.page_size}
+            )
+            if response is None:
+                return None
+            
+            batch = response.get('worklogs', [])
+            worklogs.extend(batch)
+            if not batch or start_at + len(batch) >= response.get('total', 0):
+                return worklogs
+            start_at += len(batch)
+    
+    def _issue_requests_cached(self, issue_data: Dict, checked_accounts: set) -> bool:
+        """Check the worklog and user-details requests parsing this issue would make are cached"""
+        worklog_data = issue_data.get('fields', {}).get('worklog', {})
+        worklog_list = worklog_data.get('worklogs', [])
+        if worklog_data.get('total', len(worklog_list)) > len(worklog_list):
+            worklog_list = self._cached_worklogs(issue_data.get('key'))
+            if worklog_list is None:
+                return False
         
-        logger.info(f"Fetching issues for {project_key} from {start_date} to {end_date}")
+        for wl in worklog_list:
+            author_data = wl.get('author', {})
+            account_id = author_data.get('accountId')
+            if author_data.get('active') is not None or not account_id or account_id in checked_accounts:
+                continue
+            if self._load_cached(f"user?accountId={account_id}") is None:
+                return False
+            checked_accounts.add(account_id)
+        return True
+    
+    def cache_manifest_covers(self, year: int, project_keys: List[str]) -> bool:
+        """Check whether every request for the full year of every project is cached
         
-        while True:
-            params['startAt'] = start_at
-            response = self._make_request("search/jql", params)
+        The cached first page gives the total and the page size, so every
+        later page get_issues_with_worklog would request is checked as well.
+        The cached issues are then scanned for the truncated worklogs and
+        missing author active flags that parse_issues_batch would fetch.
+        """
+        if not self.enable_cache or not project_keys:
+            return False
+        
+        start_date, end_date = get_year_range(year)
+        checked_accounts = set()
+        for project_key in project_keys:
+            params = self._build_worklog_search_params(
+                project_key, format_date_for_jql(start_date), format_date_for_jql(end_date)
+            )
+            first_page = self._load_cached('search/jql', dict(params, startAt=0))
+            if first_page is None:
+                return False
             
-            batch = response.get('issues', [])
-            issues.extend(batch)
+            pages = [first_page]
+            total = first_page.get('total', 0)
+            step = len(first_page.get('issues', []))
+            if step and total > step:
+                for start_at in range(step, total, step):
+                    page = self._load_cached('search/jql', dict(params, startAt=start_at))
+                    if page is None:
+                        return False
+                    pages.append(page)
             
-            total = response.get('total', 0)
-            logger.debug(f"Fetched {len(issues)}/{total} issues")
+            for page in pages:
+                for issue_data in page.get('issues', []):
+                    if not self._issue_requests_cached(issue_data, checked_accounts):
+                        return False
+        return True
+    
+    def get_issues_with_worklog(
+        self,
+        project_key: str,
+        start_date: str,
+        end_date: str,
+        filter_user: Optional[str] = None,
+        page_size: Optional[int] = None
+    ) -> List[Dict]:
+        """Fetch issues with worklog data
+        
+        The first page gives the total and the page size the server actually
+        honours, so the remaining pages are requested concurrently.
+        
+        Args:
+            page_size: maxResults per search request (defaults to config.page_size)
+        """
+        params = self._build_worklog_search_params(project_key, start_date, end_date, filter_user, page_size)
+        params['startAt'] = 0
+        
+        logger.info(f"Fetching issues for {project_key} from {start_date} to {end_date}")
+        
+        response = self._make_request("search/jql", params)
+        issues = list(response.get('issues', []))
+        total = response.get('total', 0)
+        step = len(issues)
+        
+        if step and total > step:
+            offsets = range(step, total, step)
+            logger.debug(f"Fetching {len(offsets)} more pages of {step} for {project_key} ({total} issues)")
             
-            if start_at + len(batch) >= total:
-                break
+            def fetch_page(start_at: int) -> List[Dict]:
+                return self._make_request("search/jql", dict(params, startAt=start_at)).get('issues', [])
             
-            start_at += len(batch)
+            # map keeps page order regardless of completion order
+            for batch in self._page_executor.map(fetch_page, offsets):
+                issues.extend(batch)
         
         logger.info(f"Fetched {len(issues)} issues for {project_key}")
         return issues
@@ -207,12 +382,12 @@ class JiraClient:
     def _parse_components(self, fields: Dict) -> List[Component]:
         """Parse components from issue fields"""
         components = [
-            Component(name=c['name'], id=c.get('id'))
+            Component.intern(self._component_pool, name=c['name'], id=c.get('id'))
             for c in fields.get('components', [])
         ]
         
         if not components:
-            components = [Component(name='Unassigned')]
+            components = [Component.intern(self._component_pool, name='Unassigned')]
         
         return components
 
@@ -228,13 +403,10 @@ class JiraClient:
             active = True
         return active
 
-    def _parse_worklogs(self, issue_data: Dict, fetch_all_worklogs: bool) -> List[Worklog]:
-        """Parse worklogs from issue data"""
-        fields = issue_data.get('fields', {})
+    def _get_worklog_list(self, issue_data: Dict, fetch_all_worklogs: bool) -> List[Dict]:
+        """Get raw worklogs for an issue, fetching the rest if the response was truncated"""
         issue_key = issue_data.get('key')
-        
-        worklogs = []
-        worklog_data = fields.get('worklog', {})
+        worklog_data = issue_data.get('fields', {}).get('worklog', {})
         worklog_list = worklog_data.get('worklogs', [])
         total_worklogs = worklog_data.get('total', len(worklog_list))
         
@@ -243,35 +415,55 @@ class JiraClient:
             logger.debug(f"{issue_key}: Fetching all {total_worklogs} worklogs (response had {len(worklog_list)})")
             worklog_list = self.get_all_worklogs_for_issue(issue_key)
         
-        for wl in worklog_list:
-            author_data = wl.get('author', {})
-            active = self._get_author_active_status(author_data)
-            
-            author = Author(
-                email=author_data.get('emailAddress', 'unknown'),
-                display_name=author_data.get('displayName', 'Unknown'),
-                account_id=author_data.get('accountId'),
-                active=active
-            )
-            
-            worklog = Worklog(
-                id=wl.get('id'),
-                author=author,
-                time_spent_seconds=wl.get('timeSpentSeconds', 0),
-                started=datetime.fromisoformat(wl['started'].replace('Z', '+00:00')),
-                issue_key=issue_key,
-                comment=wl.get('comment', {}).get('content') if isinstance(wl.get('comment'), dict) else None
-            )
-            worklogs.append(worklog)
+        return worklog_list
+
+    def _parse_author(self, author_data: Dict) -> Author:
+        """Parse worklog author data into an Author shared by identical payloads
         
-        return worklogs
+        The pool is checked before the active-status lookup, so each distinct
+        author payload costs at most one user-details request per client.
+        """
+        email = author_data.get('emailAddress', 'unknown')
+        display_name = author_data.get('displayName', 'Unknown')
+        account_id = author_data.get('accountId')
+        key = (account_id, email, display_name, author_data.get('active'))
+        author = self._author_pool.get(key)
+        if author is None:
+            author = self._author_pool.setdefault(key, Author(
+                email=email,
+                display_name=display_name,
+                account_id=account_id,
+                active=self._get_author_active_status(author_data)
+            ))
+        return author
 
-    def parse_issue(self, issue_data: Dict, fetch_all_worklogs: bool = True) -> Issue:
-        """Parse raw issue data into Issue model"""
+    def _build_worklog(self, wl: Dict, author: Author, issue_key: str) -> Worklog:
+        """Build a Worklog from raw worklog data"""
+        return Worklog(
+            id=wl.get('id'),
+            author=author,
+            time_spent_seconds=wl.get('timeSpentSeconds', 0),
+            started=parse_jira_datetime(wl['started']),
+            issue_key=issue_key,
+            comment=wl.get('comment', {}).get('content') if isinstance(wl.get('comment'), dict) else None
+        )
+
+    def _parse_worklogs(self, issue_data: Dict, fetch_all_worklogs: bool) -> List[Worklog]:
+        """Parse worklogs from issue data"""
+        issue_key = issue_data.get('key')
+        return [
+            self._build_worklog(wl, self._parse_author(wl.get('author', {})), issue_key)
+            for wl in self._get_worklog_list(issue_data, fetch_all_worklogs)
+        ]
+
+    def _build_issue(
+        self,
+        issue_data: Dict,
+        components: List[Component],
+        worklogs: List[Worklog]
+    ) -> Issue:
+        """Build an Issue model from raw issue data and parsed parts"""
         fields = issue_data.get('fields', {})
-        
-        components = self._parse_components(fields)
-        worklogs = self._parse_worklogs(issue_data, fetch_all_worklogs)
         work_type = self._categorize_work_type(fields)
         
         return Issue(
@@ -282,16 +474,64 @@ class JiraClient:
             labels=fields.get('labels', []),
             work_type=work_type,
             worklogs=worklogs,
-            custom_fields={k: v for k, v in fields.items() if k.startswith('customfield_')}
+            custom_fields={k: v for k, v in fields.items() if k.startswith('customfield_')},
+            worklog_table=WorklogTable.from_worklogs(worklogs, work_type)
         )
+
+    def parse_issue(self, issue_data: Dict, fetch_all_worklogs: bool = True) -> Issue:
+        """Parse raw issue data into Issue model"""
+        components = self._parse_components(issue_data.get('fields', {}))
+        worklogs = self._parse_worklogs(issue_data, fetch_all_worklogs)
+        return self._build_issue(issue_data, components, worklogs)
+
+    def parse_issues_batch(self, raw_issues: List[Dict], fetch_all_worklogs: bool = True) -> List[Issue]:
+        """Parse a batch of raw issues into Issue models
+        
+        Worklogs from every issue are gathered into flat lists first and
+        built in one pass; authors come from the client's pool, so each
+        distinct author payload needs its active-status lookup only once.
+        """
+        get_worklog_list = self._get_worklog_list
+        build_worklog = self._build_worklog
+        
+        worklog_lists = [get_worklog_list(raw, fetch_all_worklogs) for raw in raw_issues]
+        
+        # Flat parallel lists across the batch
+        flat_worklogs = [wl for worklog_list in worklog_lists for wl in worklog_list]
+        flat_issue_keys = [
+            raw.get('key')
+            for raw, worklog_list in zip(raw_issues, worklog_lists)
+            for _ in worklog_list
+        ]
+        
+        # Each distinct author payload is resolved once through the client's pool
+        parse_author = self._parse_author
+        flat_authors = [parse_author(wl.get('author', {})) for wl in flat_worklogs]
+        
+        worklogs = [
+            build_worklog(wl, author, issue_key)
+            for wl, author, issue_key in zip(flat_worklogs, flat_authors, flat_issue_keys)
+        ]
+        
+        # Split the flat worklogs back per issue and build the models
+        issues = []
+        offset = 0
+        for raw, worklog_list in zip(raw_issues, worklog_lists):
+            count = len(worklog_list)
+            components = self._parse_components(raw.get('fields', {}))
+            issues.append(self._build_issue(raw, components, worklogs[offset:offset + count]))
+            offset += count
+        
+        return issues
     
-    def _check_field_for_category(self, fields: Dict, field_key: str) -> Optional[WorkType]:
+    @staticmethod
+    def _check_field_for_category(fields: Dict, field_key: str) -> Optional[WorkType]:
         """Check a specific field for work category keywords"""
         field_value = fields.get(field_key)
         if not field_value:
             return None
             
-        category_value = self._extract_field_value(field_value).lower()
+        category_value = JiraClient._extract_field_value(field_value).lower()
         
         if 'maintenance' in category_value:
             return WorkType.MAINTENANCE
@@ -299,12 +539,13 @@ class JiraClient:
             return WorkType.DEVELOPMENT
         return None
 
-    def _categorize_work_type(self, fields: Dict) -> WorkType:
+    @staticmethod
+    def _categorize_work_type(fields: Dict) -> WorkType:
         """Categorize work type based on issue fields"""
         
         # Check custom fields for man hours category
         for field_key in ['customfield_10082', 'customfield_10048', 'customfield_10081']:
-            work_type = self._check_field_for_category(fields, field_key)
+            work_type = JiraClient._check_field_for_category(fields, field_key)
             if work_type:
                 return work_type
         
@@ -321,7 +562,8 @@ class JiraClient:
         
         return WorkType.DEVELOPMENT
     
-    def _extract_field_value(self, field_value) -> str:
+    @staticmethod
+    def _extract_field_value(field_value) -> str:
         """Extract string value from various field formats"""
         if isinstance(field_value, dict):
             return field_value.get('value', '')
@@ -335,7 +577,7 @@ class JiraClient:
         try:
             worklogs = []
             start_at = 0
-            max_results = 1000  # Increased from 100 to 1000
+            max_results = self.config.page_size
             
             while True:
                 response = self._make_request(
@@ -4,9 +4,14 @@ Data models for Automate Jira
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import List, Dict, Optional, Sequence, Set
 from enum import Enum
 
+import numpy as np
+
+from .utils.date_utils import split_wall_clock, get_week_number, get_week_numbers
+
 
 class WorkType(Enum):
     """Work type classification"""
@@ -15,19 +20,24 @@ class WorkType(Enum):
     UNCLASSIFIED = "Unclassified"
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Author:
     """Worklog author information"""
     email: str
     display_name: str
     account_id: Optional[str] = None
     active: bool = True  # User active status from Jira API
+    _hash: int = field(init=False, repr=False, compare=False)
     
-    def __hash__(self):
+    def __post_init__(self):
         # Use account_id if available, otherwise use email+display_name
         if self.account_id:
-            return hash(self.account_id)
-        return hash((self.email, self.display_name))
+            object.__setattr__(self, '_hash', hash(self.account_id))
+        else:
+            object.__setattr__(self, '_hash', hash((self.email, self.display_name)))
+    
+    def __hash__(self):
+        return self._hash
     
     def __eq__(self, other):
         if isinstance(other, Author):
@@ -39,7 +49,7 @@ class Author:
         return False
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Component:
     """Jira component"""
     name: str
@@ -48,9 +58,22 @@ class Component:
     
     def __hash__(self):
         return hash(self.name)
+    
+    @classmethod
+    def intern(cls, pool: Dict[tuple, "Component"], name: str, id: Optional[str] = None) -> "Component":
+        """Get the Component for this name and id from pool, creating it on first use
+        
+        The pool belongs to the caller (one per JiraClient), so interned
+        components live no longer than the client that parsed them.
+        """
+        key = (name, id)
+        component = pool.get(key)
+        if component is None:
+            component = pool.setdefault(key, cls(name=name, id=id))
+        return component
 
 
-@dataclass
+@dataclass(slots=True)
 class Worklog:
     """Individual worklog entry"""
     id: str
@@ -59,20 +82,105 @@ class Worklog:
     started: datetime
     issue_key: str
     comment: Optional[str] = None
+    hours: float = field(init=False)  # Hours from time spent, computed once
+    week_number: int = field(init=False)  # Week number within month (1-5)
+    
+    def __post_init__(self):
+        self.hours = self.time_spent_seconds / 3600
+        self.week_number = get_week_number(self.started)
+
+
+# Stable integer codes for WorkType, used by the columnar worklog table
+WORK_TYPES: List[WorkType] = list(WorkType)
+WORK_TYPE_CODES: Dict[WorkType, int] = {wt: code for code, wt in enumerate(WORK_TYPES)}
+
+
+@dataclass(slots=True)
+class WorklogTable:
+    """Columnar (structure-of-arrays) view of worklogs
+    
+    Each column holds one value per worklog so that filtering and aggregation
+    run over contiguous arrays instead of walking Worklog objects.
+    """
+    time_spent_seconds: np.ndarray  # int64
+    started: np.ndarray  # datetime64[us], UTC for timezone-aware input
+    week_number: np.ndarray  # int8, week within month (1-5)
+    author_id: np.ndarray  # int32, index into ``authors``
+    issue_idx: np.ndarray  # int32, index of the source issue
+    work_type: np.ndarray  # int8, index into WORK_TYPES
+    authors: List[Author] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.time_spent_seconds)
     
     @property
-    def hours(self) -> float:
-        """Get hours from time spent"""
+    def hours(self) -> np.ndarray:
+        """Get hours column from time spent"""
         return self.time_spent_seconds / 3600
     
-    @property
-    def week_number(self) -> int:
-        """Get week number within month (1-5)"""
-        week = ((self.started.day - 1) // 7) + 1
-        return min(week, 5)
+    @classmethod
+    def from_worklogs(
+        cls,
+        worklogs: Sequence[Worklog],
+        work_type: WorkType = WorkType.UNCLASSIFIED
+    ) -> "WorklogTable":
+        """Build a table from the worklogs of a single issue"""
+        authors: List[Author] = []
+        author_ids: Dict[Author, int] = {}
+        author_column = []
+        for worklog in worklogs:
+            author_id = author_ids.get(worklog.author)
+            if author_id is None:
+                author_id = author_ids[worklog.author] = len(authors)
+                authors.append(worklog.author)
+            author_column.append(author_id)
+        
+        count = len(worklogs)
+        # Weeks follow the worklog's own calendar day, so derive them before normalizing to UTC
+        wall_clock, offsets = split_wall_clock([wl.started for wl in worklogs])
+        return cls(
+            time_spent_seconds=np.array([wl.time_spent_seconds for wl in worklogs], dtype=np.int64),
+            started=wall_clock - offsets,
+            week_number=get_week_numbers(wall_clock),
+            author_id=np.array(author_column, dtype=np.int32),
+            issue_idx=np.zeros(count, dtype=np.int32),
+            work_type=np.full(count, WORK_TYPE_CODES[work_type], dtype=np.int8),
+            authors=authors
+        )
+    
+    @classmethod
+    def concatenate(cls, tables: Sequence["WorklogTable"]) -> "WorklogTable":
+        """Concatenate per-issue tables into one
+        
+        ``issue_idx`` of the result is the position of the source table, and
+        author ids are remapped onto a single de-duplicated author list.
+        """
+        authors: List[Author] = []
+        author_ids: Dict[Author, int] = {}
+        author_columns = []
+        for table in tables:
+            remap = np.empty(len(table.authors), dtype=np.int32)
+            for local_id, author in enumerate(table.authors):
+                global_id = author_ids.get(author)
+                if global_id is None:
+                    global_id = author_ids[author] = len(authors)
+                    authors.append(author)
+                remap[local_id] = global_id
+            author_columns.append(remap[table.author_id])
+        
+        sizes = [len(table) for table in tables]
+        return cls(
+            time_spent_seconds=np.concatenate([t.time_spent_seconds for t in tables] or [np.empty(0, dtype=np.int64)]),
+            started=np.concatenate([t.started for t in tables] or [np.empty(0, dtype='datetime64[us]')]),
+            week_number=np.concatenate([t.week_number for t in tables] or [np.empty(0, dtype=np.int8)]),
+            author_id=np.concatenate(author_columns or [np.empty(0, dtype=np.int32)]),
+            issue_idx=np.repeat(np.arange(len(tables), dtype=np.int32), sizes),
+            work_type=np.concatenate([t.work_type for t in tables] or [np.empty(0, dtype=np.int8)]),
+            authors=authors
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class Issue:
     """Jira issue"""
     key: str
@@ -83,6 +191,13 @@ class Issue:
     work_type: WorkType
     worklogs: List[Worklog] = field(default_factory=list)
     custom_fields: Dict[str, any] = field(default_factory=dict)
+    worklog_table: Optional[WorklogTable] = field(default=None, repr=False, compare=False)
+    
+    def get_worklog_table(self) -> WorklogTable:
+        """Get the columnar worklog table, building it on first use"""
+        if self.worklog_table is None:
+            self.worklog_table = WorklogTable.from_worklogs(self.worklogs, self.work_type)
+        return self.worklog_table
     
     def get_total_hours(self) -> float:
         """Get total hours for this issue"""
@@ -97,14 +212,35 @@ class Issue:
         return hours_by_author
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProjectComponent:
     """Project-Component combination"""
     project: str
     component: Component
+    _hash: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, '_hash', hash((self.project, self.component.name)))
     
     def __hash__(self):
-        return hash((self.project, self.component.name))
+        return self._hash
+    
+    @classmethod
+    def intern(
+        cls,
+        pool: Dict[tuple, "ProjectComponent"],
+        project: str,
+        component: Component
+    ) -> "ProjectComponent":
+        """Get the ProjectComponent for this project and component from pool, creating it on first use
+        
+        The pool belongs to the caller (one per WorklogProcessor).
+        """
+        key = (project, component.name, component.id)
+        project_component = pool.get(key)
+        if project_component is None:
+            project_component = pool.setdefault(key, cls(project=project, component=component))
+        return project_component
     
     def __eq__(self, other):
         if isinstance(other, ProjectComponent):
@@ -115,7 +251,7 @@ class ProjectComponent:
         return f"{self.project} - {self.component.name}"
 
 
-@dataclass
+@dataclass(slots=True)
 class TimeEntry:
     """Aggregated time entry"""
     project_component: ProjectComponent
@@ -124,17 +260,46 @@ class TimeEntry:
     work_type: WorkType
     issues: List[str] = field(default_factory=list)
     week_hours: Dict[int, float] = field(default_factory=dict)  # week_number -> hours
+    _issue_set: Set[str] = field(init=False, repr=False, compare=False)  # Mirrors issues for O(1) membership
+    
+    def __post_init__(self):
+        self._issue_set = set(self.issues)
+    
+    def copy(self) -> "TimeEntry":
+        """Copy this entry so it can be merged into without touching the original"""
+        return TimeEntry(
+            project_component=self.project_component,
+            author=self.author,
+            hours=self.hours,
+            work_type=self.work_type,
+            issues=list(self.issues),
+            week_hours=dict(self.week_hours)
+        )
+    
+    def merge_issues(self, issue_keys: List[str]):
+        """Append issue keys not already on this entry, preserving order"""
+        for issue_key in issue_keys:
+            if issue_key not in self._issue_set:
+                self._issue_set.add(issue_key)
+                self.issues.append(issue_key)
     
     def add_hours(self, hours: float, issue_key: Optional[str] = None, week: Optional[int] = None):
         """Add hours to this entry"""
         self.hours += hours
-        if issue_key and issue_key not in self.issues:
+        if issue_key and issue_key not in self._issue_set:
+            self._issue_set.add(issue_key)
             self.issues.append(issue_key)
         if week is not None:
             self.week_hours[week] = self.week_hours.get(week, 0) + hours
 
 
-@dataclass
+@lru_cache(maxsize=12)
+def _month_name(month: int) -> str:
+    """Get the full month name for a month number"""
+    return datetime(2000, month, 1).strftime('%B')
+
+
+@dataclass(slots=True)
 class MonthlyReport:
     """Monthly time tracking report"""
     year: int
@@ -145,7 +310,7 @@ class MonthlyReport:
     @property
     def month_name(self) -> str:
         """Get month name"""
-        return datetime(self.year, self.month, 1).strftime('%B')
+        return _month_name(self.month)
     
     def get_total_hours(self) -> float:
         """Get total hours for the month"""
@@ -168,7 +333,7 @@ class MonthlyReport:
         return hours_by_author
 
 
-@dataclass
+@dataclass(slots=True)
 class YearlyReport:
     """Yearly time tracking report"""
     year: int
@@ -201,4 +366,4 @@ class YearlyReport:
     @property
     def months_with_data(self) -> int:
         """Count months with data"""
-        return len([r for r in self.monthly_reports if r.get_total_hours() > 0])
+        return sum(1 for r in self.monthly_reports if any(entry.hours > 0 for entry in r.entries))
@@ -3,24 +3,49 @@ Worklog data processing and aggregation
 """
 
 import logging
-from typing import List, Dict
+from typing import List, Dict, Tuple, Iterable
 from datetime import datetime, timedelta
-from collections import defaultdict
+
+import numpy as np
+import pandas as pd
 
 from ..models import (
     Issue, TimeEntry, ProjectComponent, MonthlyReport,
-    YearlyReport, Author, Component
+    YearlyReport, Author, Component, WorklogTable, WORK_TYPES
 )
+from ..utils.date_utils import to_datetime64, get_month_range
 from ..config import ReportConfig
 
 logger = logging.getLogger(__name__)
 
+# Week numbers run 1-5, so slot 0 of each group's week row is unused
+_WEEK_SLOTS = 6
+
+
+def _group_sum(group_ids: np.ndarray, values: np.ndarray, num_groups: int) -> np.ndarray:
+    """Sum values per group id into a dense array of length num_groups
+    
+    np.bincount adds values in input order, so sums match sequential
+    accumulation over the same rows.
+    """
+    return np.bincount(group_ids, weights=values, minlength=num_groups)
+
+
+def _unique_pairs(group_ids: np.ndarray, members: np.ndarray, num_members: int) -> List[Tuple[int, int]]:
+    """Get distinct (group_id, member) pairs in order of first appearance"""
+    pair_keys = group_ids.astype(np.int64) * num_members + members
+    _, first_index = np.unique(pair_keys, return_index=True)
+    first_index.sort()
+    return list(zip(group_ids[first_index].tolist(), members[first_index].tolist()))
+
 
 class WorklogProcessor:
     """Process and aggregate worklog data"""
     
     def __init__(self, config: ReportConfig):
         self.config = config
+        # Interned project-components, scoped to this processor (one report run)
+        self._project_component_pool: Dict[tuple, ProjectComponent] = {}
     
     def process_issues(
         self,
@@ -30,53 +55,132 @@ class WorklogProcessor:
         end_date: datetime,
         filter_author: Author = None
     ) -> List[TimeEntry]:
-        """Process issues and create time entries (optimized single-pass)"""
+        """Process issues and create time entries (columnar single-pass)"""
         
-        # Use a single dict to aggregate directly: (project_component, author, work_type) -> TimeEntry
-        aggregated = {}
+        if not issues:
+            return []
+        
+        table = WorklogTable.concatenate([issue.get_worklog_table() for issue in issues])
+        return self._process_table(table, issues, project_key, start_date, end_date, filter_author)
+    
+    def process_issues_by_month(
+        self,
+        issues: List[Issue],
+        project_key: str,
+        year: int,
+        filter_author: Author = None
+    ) -> Dict[int, List[TimeEntry]]:
+        """Process a year of issues into time entries per month
+        
+        The worklog columns are concatenated once and re-masked for each month.
+        """
+        
+        if not issues:
+            return {month: [] for month in range(1, 13)}
+        
+        table = WorklogTable.concatenate([issue.get_worklog_table() for issue in issues])
+        entries_by_month = {}
+        for month in range(1, 13):
+            start_date, end_date = get_month_range(year, month)
+            entries_by_month[month] = self._process_table(
+                table, issues, project_key, start_date, end_date, filter_author
+            )
+        return entries_by_month
+    
+    def _process_table(
+        self,
+        table: WorklogTable,
+        issues: List[Issue],
+        project_key: str,
+        start_date: datetime,
+        end_date: datetime,
+        filter_author: Author = None
+    ) -> List[TimeEntry]:
+        """Filter and aggregate a concatenated worklog table of issues"""
         
+        # Filter by date range and author on whole columns
+        mask = (table.started >= to_datetime64(start_date)) & (table.started <= to_datetime64(end_date))
+        if filter_author:
+            # Author equality is not transitive: a filter without account_id matches
+            # by email and name, which can cover several account ids in the table
+            author_ids = [author_id for author_id, author in enumerate(table.authors) if author == filter_author]
+            if not author_ids:
+                return []
+            mask &= np.isin(table.author_id, author_ids)
+        rows = np.flatnonzero(mask)
+        
+        # Expand each worklog row once per component of its issue, ordered by
+        # (issue, component, worklog) so entries are built in the same order as before
+        num_components = np.array([len(issue.components) for issue in issues], dtype=np.int64)
+        row_issue = table.issue_idx[rows]
+        repeats = num_components[row_issue]
+        expanded_rows = np.repeat(rows, repeats)
+        component_pos = np.arange(expanded_rows.size) - np.repeat(np.cumsum(repeats) - repeats, repeats)
+        order = np.lexsort((expanded_rows, component_pos, table.issue_idx[expanded_rows]))
+        expanded_rows = expanded_rows[order]
+        component_pos = component_pos[order]
+        
+        # Split hours equally among components
+        row_issue = table.issue_idx[expanded_rows]
+        hours = table.hours[expanded_rows] / num_components[row_issue]
+        
+        # Map each (issue, component position) to a project-component id
+        project_components: List[ProjectComponent] = []
+        project_component_ids: Dict[ProjectComponent, int] = {}
+        flat_pc_ids = []
         for issue in issues:
             for component in issue.components:
-                project_component = ProjectComponent(
-                    project=project_key,
-                    component=component
-                )
-                
-                for worklog in issue.worklogs:
-                    # Filter by author if specified (using Author equality)
-                    if filter_author and worklog.author != filter_author:
-                        continue
-                    
-                    # Filter by date range
-                    if not (start_date <= worklog.started <= end_date):
-                        continue
-                    
-                    # Create aggregation key
-                    key = (project_component, worklog.author, issue.work_type)
-                    
-                    # Add or update entry
-                    week_num = worklog.week_number
-                    # Split hours equally among components
-                    num_components = len(issue.components)
-                    hours_per_component = worklog.hours / num_components if num_components > 0 else worklog.hours
-                    
-                    if key in aggregated:
-                        aggregated[key].add_hours(hours_per_component, issue.key, week_num)
-                    else:
-                        entry = TimeEntry(
-                            project_component=project_component,
-                            author=worklog.author,
-                            hours=hours_per_component,
-                            work_type=issue.work_type,
-                            issues=[issue.key]
-                        )
-                        entry.week_hours[week_num] = hours_per_component
-                        aggregated[key] = entry
-        
-        return list(aggregated.values())
+                project_component = ProjectComponent.intern(self._project_component_pool, project_key, component)
+                pc_id = project_component_ids.get(project_component)
+                if pc_id is None:
+                    pc_id = project_component_ids[project_component] = len(project_components)
+                    project_components.append(project_component)
+                flat_pc_ids.append(pc_id)
+        component_offsets = np.cumsum(num_components) - num_components
+        row_pc = np.array(flat_pc_ids, dtype=np.int64)[component_offsets[row_issue] + component_pos]
+        
+        # Linearize (project_component, author, work_type) into one group id per row
+        group_keys = (
+            (row_pc * len(table.authors) + table.author_id[expanded_rows]) * len(WORK_TYPES)
+            + table.work_type[expanded_rows]
+        )
+        _, first_index, group_ids = np.unique(group_keys, return_index=True, return_inverse=True)
+        num_groups = first_index.size
+        week_numbers = table.week_number[expanded_rows]
+        
+        group_hours = _group_sum(group_ids, hours, num_groups)
+        week_slots = group_ids * _WEEK_SLOTS + week_numbers
+        group_week_hours = _group_sum(week_slots, hours, num_groups * _WEEK_SLOTS).reshape(num_groups, _WEEK_SLOTS)
+        group_week_seen = np.bincount(week_slots, minlength=num_groups * _WEEK_SLOTS).reshape(num_groups, _WEEK_SLOTS) > 0
+        
+        # Collect unique issue keys per group in first-seen order
+        group_issues = [[] for _ in range(num_groups)]
+        for group_id, issue_idx in _unique_pairs(group_ids, row_issue, len(issues)):
+            group_issues[group_id].append(issues[issue_idx].key)
+        
+        # Materialize one TimeEntry per group, in order of first appearance
+        entries = []
+        for group_id in np.argsort(first_index, kind='stable').tolist():
+            row = expanded_rows[first_index[group_id]]
+            entry = TimeEntry(
+                project_component=project_components[row_pc[first_index[group_id]]],
+                author=table.authors[table.author_id[row]],
+                hours=float(group_hours[group_id]),
+                work_type=WORK_TYPES[table.work_type[row]],
+                issues=group_issues[group_id]
+            )
+            for week in np.flatnonzero(group_week_seen[group_id]).tolist():
+                entry.week_hours[week] = float(group_week_hours[group_id, week])
+            entries.append(entry)
+        
+        return entries
     
-    def aggregate_entries(self, entries: List[TimeEntry]) -> Dict[tuple, TimeEntry]:
-        """Aggregate time entries by project-component-author-worktype (optimized)"""
+    def aggregate_entries(self, entries: Iterable[TimeEntry]) -> Dict[tuple, TimeEntry]:
+        """Aggregate time entries by project-component-author-worktype (optimized)
+        
+        Input entries are left untouched, so the same entries can be aggregated
+        again (e.g. monthly data reused for the yearly overview).
+        """
         
         aggregated = {}
         
@@ -86,19 +190,27 @@ class WorklogProcessor:
                 entry.author,
                 entry.work_type
             )
-            
             if key in aggregated:
-                # Merge hours and issues
-                aggregated[key].hours += entry.hours
-                # Add unique issues only
-                for issue in entry.issues:
-                    if issue not in aggregated[key].issues:
-                        aggregated[key].issues.append(issue)
+                self._merge_entry(aggregated, key, entry)
             else:
-                aggregated[key] = entry
+                aggregated[key] = entry.copy()
         
         return aggregated
     
+    def _merge_entry(self, aggregated: Dict[tuple, TimeEntry], key: tuple, entry: TimeEntry):
+        """Merge a single entry into an aggregate under key"""
+        existing = aggregated.get(key)
+        if existing is None:
+            aggregated[key] = entry
+            return
+        
+        # Merge hours and issues
+        existing.hours += entry.hours
+        # Add unique issues only
+        existing.merge_issues(entry.issues)
+        for week, hours in entry.week_hours.items():
+            existing.week_hours[week] = existing.week_hours.get(week, 0) + hours
+    
     def create_monthly_report(
         self,
         project_keys: List[str],
@@ -135,10 +247,25 @@ class WorklogProcessor:
     ) -> Dict[ProjectComponent, Dict[Author, float]]:
         """Prepare data for CSV export"""
         
-        # Structure: {ProjectComponent: {Author: hours}}
-        csv_data = defaultdict(lambda: defaultdict(float))
+        if not entries:
+            return {}
         
-        for entry in entries:
-            csv_data[entry.project_component][entry.author] += entry.hours
+        # Pivot hours to project_component rows x author columns
+        frame = pd.DataFrame({
+            'project_component': [entry.project_component for entry in entries],
+            'author': [entry.author for entry in entries],
+            'hours': [entry.hours for entry in entries],
+        })
+        pivot = frame.pivot_table(
+            index='project_component',
+            columns='author',
+            values='hours',
+            aggfunc='sum',
+            sort=False
+        )
         
-        return dict(csv_data)
+        # Structure: {ProjectComponent: {Author: hours}}, without the empty pivot cells
+        return {
+            project_component: {author: hours for author, hours in row.items() if pd.notna(hours)}
+            for project_component, row in pivot.to_dict(orient='index').items()
+        }
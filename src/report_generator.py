@@ -3,12 +3,14 @@ Report generation module for Jira time tracking
 """
 
 import logging
+import os
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Tuple, Optional, Dict, Any
+from typing import Callable, List, Tuple, Optional, Dict, Any, Iterator
 from enum import Enum
 import time
+from itertools import chain
 
 from .config import Config
 from .jira_client import JiraClient, JiraClientError
@@ -19,9 +21,9 @@ from .exporters import (
     MonthlyBreakdownExporter,
     WeeklyBreakdownExporter
 )
-from .utils import get_month_range, format_date_for_jql
+from .utils import get_year_range, format_date_for_jql
 from .utils.date_utils import MALAYSIA_TZ
-from .models import YearlyReport, MonthlyReport
+from .models import YearlyReport, MonthlyReport, TimeEntry
 
 logger = logging.getLogger(__name__)
 
@@ -62,115 +64,155 @@ class ReportConfig:
         return cls.DEFAULT_FILENAMES[report_type].format(year=year)
 
 
-def fetch_month_project_data(
+def _fetch_raw_issues(
+    client: JiraClient,
+    project_key: str,
+    start_date: datetime,
+    end_date: datetime,
+    filter_author=None
+) -> List[Dict[str, Any]]:
+    """Fetch raw issue payloads with worklogs in the date range (network-bound stage)"""
+    # Fetch issues (filtered by user email if specified)
+    filter_user_email = filter_author.email if filter_author and filter_author.email else None
+    return client.get_issues_with_worklog(
+        project_key,
+        format_date_for_jql(start_date),
+        format_date_for_jql(end_date),
+        filter_user=filter_user_email
+    )
+
+
+def default_max_workers() -> int:
+    """Default worker count for the I/O-bound fetch stage
+    
+    Threads mostly wait on HTTP, so allow several per CPU (capped at 32).
+    """
+    return min(32, (os.cpu_count() or 1) * 5)
+
+
+def fetch_year_project_data(
     client: JiraClient,
     processor: WorklogProcessor,
     project_key: str,
     year: int,
-    month: int,
     filter_author=None
-) -> Tuple[str, int, List]:
-    """Fetch and process data for a single month-project combination"""
+) -> Tuple[str, Dict[int, List[TimeEntry]]]:
+    """Fetch a full year of data for a project with one JQL search and bucket it by month
+    
+    Returns the time entries for each month, already one per
+    (project_component, author, work_type).
+    """
     try:
-        start_date, end_date = get_month_range(year, month)
-        start_str = format_date_for_jql(start_date)
-        end_str = format_date_for_jql(end_date)
-
-        # Fetch issues (filtered by user email if specified)
-        filter_user_email = filter_author.email if filter_author and filter_author.email else None
-        raw_issues = client.get_issues_with_worklog(
-            project_key,
-            start_str,
-            end_str,
-            filter_user=filter_user_email
-        )
+        start_date, end_date = get_year_range(year)
+        raw_issues = _fetch_raw_issues(client, project_key, start_date, end_date, filter_author)
 
-        # Parse issues - fetch all worklogs to get all team members
-        issues = [client.parse_issue(raw, fetch_all_worklogs=True) for raw in raw_issues]
+        # Parse issues once - fetch all worklogs to get all team members
+        issues = client.parse_issues_batch(raw_issues, fetch_all_worklogs=True)
 
-        # Process into time entries (filter by author if specified)
-        entries = processor.process_issues(
+        # Bucket worklogs into months locally
+        entries_by_month = processor.process_issues_by_month(
             issues,
             project_key,
-            start_date,
-            end_date,
+            year,
             filter_author=filter_author
         )
 
-        logger.info(f"✓ {project_key} {year}-{month:02d}: {len(entries)} entries")
-        return (project_key, month, entries)
+        total_entries = sum(len(entries) for entries in entries_by_month.values())
+        logger.info(f"✓ {project_key} {year}: {total_entries} entries")
+        return (project_key, entries_by_month)
 
     except JiraClientError as e:
-        logger.warning(f"Failed to process {project_key} for {year}-{month:02d}: {e}")
-        return (project_key, month, [])
+        logger.warning(f"Failed to process {project_key} for {year}: {e}")
+        return (project_key, {})
 
 
-def _fetch_data_parallel(
+def _iter_project_results(
     client: JiraClient,
     processor: WorklogProcessor,
     project_keys: List[str],
     year: int,
-    max_workers: int,
-    preserve_months: bool = False
-) -> dict:
-    """Fetch data in parallel for all month-project combinations
+    max_workers: int
+) -> Iterator[Tuple[str, Dict[int, List[TimeEntry]]]]:
+    """Fetch projects in parallel and yield (project_key, entries_by_month) as each completes
     
-    Args:
-        preserve_months: If True, returns dict with month keys. If False, returns flat list.
+    Failed projects are logged and skipped.
     """
-    # Create tasks for all month-project combinations
-    tasks = []
-    for month in range(1, 13):
-        for project_key in project_keys:
-            tasks.append((project_key, year, month))
-
-    logger.info(f"Processing {len(tasks)} month-project combinations in parallel...")
-    fetch_start = time.time()
-
-    # Store entries by month if needed
-    if preserve_months:
-        entries_by_month = {month: [] for month in range(1, 13)}
-    else:
-        all_entries = []
-
-    # Execute tasks in parallel
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        # Submit all tasks
-        future_to_task = {
-            executor.submit(fetch_month_project_data, client, processor, pk, y, m, None): (pk, m)
-            for pk, y, m in tasks
+        # Submit one task per project
+        future_to_project = {
+            executor.submit(fetch_year_project_data, client, processor, pk, year, None): pk
+            for pk in project_keys
         }
 
-        # Collect results as they complete
+        # Yield results as they complete
         completed = 0
-        for future in as_completed(future_to_task):
-            project_key, month = future_to_task[future]
+        for future in as_completed(future_to_project):
+            project_key = future_to_project[future]
             completed += 1
             try:
-                _, result_month, entries = future.result()
-                if preserve_months:
-                    entries_by_month[result_month].extend(entries)
-                else:
-                    all_entries.extend(entries)
-                logger.info(f"Progress: {completed}/{len(tasks)} completed")
+                result = future.result()
             except Exception as e:
-                logger.error(f"Task failed for {project_key} {year}-{month:02d}: {e}")
+                logger.error(f"Task failed for {project_key} {year}: {e}")
+                continue
+            logger.info(f"Progress: {completed}/{len(project_keys)} projects completed")
+            yield result
+
+
+def _fetch_data_parallel(
+    client: JiraClient,
+    processor: WorklogProcessor,
+    project_keys: List[str],
+    year: int,
+    max_workers: int
+) -> Tuple[Dict[int, List], bool]:
+    """Fetch data in parallel, one full-year task per project
+    
+    Project results are consumed from a stream as they complete. Entries are
+    always kept per month so the same data can feed every report type; the
+    yearly overview aggregates across months afterwards.
+    
+    Returns:
+        Tuple of (dict of month -> entries, whether any entries were found)
+    """
+    logger.info(f"Processing {len(project_keys)} projects in parallel (one full-year fetch each)...")
+    fetch_start = time.time()
+
+    entries_by_month = {month: [] for month in range(1, 13)}
+    has_data = False
+    for _, project_entries_by_month in _iter_project_results(client, processor, project_keys, year, max_workers):
+        for month, entries in project_entries_by_month.items():
+            if entries:
+                has_data = True
+                entries_by_month[month].extend(entries)
 
     fetch_time = time.time() - fetch_start
     logger.info(f"✓ Data fetching completed in {fetch_time:.1f}s")
 
-    return entries_by_month if preserve_months else all_entries
+    return entries_by_month, has_data
 
 
-def _initialize_client_and_processor(config: Config):
-    """Initialize Jira client and worklog processor"""
-    client = JiraClient(
+def _initialize_client_and_processor(
+    config: Config,
+    year: Optional[int] = None,
+    client_factory: Optional[Callable[..., JiraClient]] = None
+):
+    """Initialize Jira client and worklog processor
+    
+    The connection test is skipped when the cache already holds the full-year
+    search results for every configured project.
+    """
+    client_factory = client_factory or JiraClient
+    client = client_factory(
         config.jira,
         enable_cache=config.jira.enable_cache,
         cache_dir=config.jira.cache_dir
     )
     processor = WorklogProcessor(config.report)
     
+    if year is not None and client.cache_manifest_covers(year, config.jira.project_keys):
+        logger.info("Cache hit for full year - skipping connection test")
+        return client, processor
+    
     # Test connection
     if not client.test_connection():
         logger.error("Failed to connect to Jira")
@@ -234,15 +276,16 @@ def _create_yearly_report_from_entries(
     )
 
 
-def _process_yearly_data(processor: WorklogProcessor, entries_data: List) -> List:
-    """Aggregate entries for yearly report"""
+def _process_yearly_data(processor: WorklogProcessor, entries_by_month: Dict[int, List]) -> List:
+    """Aggregate monthly entries across the year for yearly report"""
     agg_start = time.time()
-    aggregated = processor.aggregate_entries(entries_data)
+    aggregated = processor.aggregate_entries(chain.from_iterable(entries_by_month.values()))
     agg_time = time.time() - agg_start
     logger.info(f"✓ Data aggregation completed in {agg_time:.1f}s")
     
     # Log unique team members
-    unique_authors = set(entry.author for entry in aggregated.values())
+    # Authors are interned with cached hashes; dict.fromkeys keeps first-seen order
+    unique_authors = dict.fromkeys(entry.author for entry in aggregated.values())
     logger.info(f"Found {len(unique_authors)} unique team members:")
     for author in sorted(unique_authors, key=lambda a: a.display_name):
         logger.info(f"  - {author.display_name} ({author.email})")
@@ -255,7 +298,8 @@ def generate_report(
     report_type: ReportType,
     year: int = None,
     output_file: str = None,
-    max_workers: int = None
+    max_workers: int = None,
+    client_factory: Optional[Callable[..., JiraClient]] = None
 ):
     """Unified report generation function
     
@@ -264,7 +308,10 @@ def generate_report(
         report_type: Type of report to generate
         year: Report year (defaults to current year)
         output_file: Output file path (defaults to standard naming)
-        max_workers: Number of parallel workers (defaults to config value)
+        max_workers: Number of parallel workers (defaults to config value, then to
+            default_max_workers()); capped at the number of projects
+        client_factory: Called like JiraClient(config.jira, enable_cache=..., cache_dir=...)
+            to build the client (defaults to JiraClient)
     
     Returns:
         For yearly reports: Path to CSV file
@@ -274,14 +321,14 @@ def generate_report(
     if year is None:
         year = datetime.now().year
     if max_workers is None:
-        max_workers = config.jira.max_workers
+        max_workers = config.jira.max_workers or default_max_workers()
     if output_file is None:
         output_file = f"reports/{ReportConfig.get_default_filename(report_type, year)}"
 
     logger.info(f"Generating {report_type.value} report for {year}")
 
     # Initialize components
-    client, processor = _initialize_client_and_processor(config)
+    client, processor = _initialize_client_and_processor(config, year, client_factory)
     if not client or not processor:
         return None
 
@@ -290,24 +337,19 @@ def generate_report(
     if not project_keys:
         return None
 
+    # No point in more threads than there are fetch tasks (one per project)
+    max_workers = min(max_workers, len(project_keys))
     logger.info(f"Using parallel processing with {max_workers} workers")
     logger.info(f"Cache: {'enabled' if config.jira.enable_cache else 'disabled'}")
 
     # Start timing
     start_time = time.time()
 
-    # Fetch data - preserve months for all except yearly overview
-    preserve_months = report_type != ReportType.YEARLY
-    entries_data = _fetch_data_parallel(
-        client, processor, project_keys, year, max_workers, preserve_months
+    # Fetch data by month - the yearly overview aggregates across months below
+    entries_by_month, has_data = _fetch_data_parallel(
+        client, processor, project_keys, year, max_workers
     )
 
-    # Check if we have data
-    if preserve_months:
-        has_data = any(entries_data.values())
-    else:
-        has_data = bool(entries_data)
-    
     if not has_data:
         logger.warning("No data found for the specified period")
         return None
@@ -317,9 +359,12 @@ def generate_report(
     output_path.parent.mkdir(parents=True, exist_ok=True)
     export_start = time.time()
 
-    # For yearly overview, aggregate entries first
-    if report_type == ReportType.YEARLY:
-        entries_data = _process_yearly_data(processor, entries_data)
+    # For yearly overview, aggregate entries across months first
+    preserve_months = report_type != ReportType.YEARLY
+    if preserve_months:
+        entries_data = entries_by_month
+    else:
+        entries_data = _process_yearly_data(processor, entries_by_month)
 
     # Create yearly report with timestamp metadata
     yearly_report = _create_yearly_report_from_entries(
@@ -355,21 +400,45 @@ def generate_report(
 
 
 # Convenience functions for backward compatibility
-def generate_csv_report(config: Config, year: int = None, output_file: str = None, max_workers: int = None):
+def generate_csv_report(
+    config: Config,
+    year: int = None,
+    output_file: str = None,
+    max_workers: int = None,
+    client_factory: Optional[Callable[..., JiraClient]] = None
+):
     """Generate CSV team overview report"""
-    return generate_report(config, ReportType.YEARLY, year, output_file, max_workers)
+    return generate_report(config, ReportType.YEARLY, year, output_file, max_workers, client_factory)
 
 
-def generate_quarterly_report(config: Config, year: int = None, output_file: str = None, max_workers: int = None):
+def generate_quarterly_report(
+    config: Config,
+    year: int = None,
+    output_file: str = None,
+    max_workers: int = None,
+    client_factory: Optional[Callable[..., JiraClient]] = None
+):
     """Generate CSV quarterly breakdown report"""
-    return generate_report(config, ReportType.QUARTERLY, year, output_file, max_workers)
+    return generate_report(config, ReportType.QUARTERLY, year, output_file, max_workers, client_factory)
 
 
-def generate_monthly_breakdown_report(config: Config, year: int = None, output_file: str = None, max_workers: int = None):
+def generate_monthly_breakdown_report(
+    config: Config,
+    year: int = None,
+    output_file: str = None,
+    max_workers: int = None,
+    client_factory: Optional[Callable[..., JiraClient]] = None
+):
     """Generate CSV monthly breakdown report"""
-    return generate_report(config, ReportType.MONTHLY, year, output_file, max_workers)
+    return generate_report(config, ReportType.MONTHLY, year, output_file, max_workers, client_factory)
 
 
-def generate_weekly_breakdown_report(config: Config, year: int = None, output_file: str = None, max_workers: int = None):
+def generate_weekly_breakdown_report(
+    config: Config,
+    year: int = None,
+    output_file: str = None,
+    max_workers: int = None,
+    client_factory: Optional[Callable[..., JiraClient]] = None
+):
     """Generate CSV weekly breakdown report"""
-    return generate_report(config, ReportType.WEEKLY, year, output_file, max_workers)
+    return generate_report(config, ReportType.WEEKLY, year, output_file, max_workers, client_factory)
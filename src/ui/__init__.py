@@ -1,23 +1,30 @@
 """
 UI components for Streamlit interface
+
+Exports are resolved on first access, so importing a submodule that does
+not need Streamlit at import time (sidebar, state_manager) does not pull
+it in through components.py.
 """
 
-from .components import (
-    show_config_error,
-    display_report_preview,
-    display_monthly_breakdown_preview
-)
-from .formatters import (
-    parse_split_csv,
-    calculate_summary_stats,
-    transform_to_multiindex
-)
+from importlib import import_module
+
+# Public name -> submodule that defines it
+_EXPORTS = {
+    'show_config_error': 'components',
+    'display_report_preview': 'components',
+    'display_monthly_breakdown_preview': 'components',
+    'parse_split_csv': 'formatters',
+    'calculate_summary_stats': 'formatters',
+    'transform_to_multiindex': 'formatters',
+}
+
+__all__ = list(_EXPORTS)
+
 
-__all__ = [
-    'show_config_error',
-    'display_report_preview',
-    'display_monthly_breakdown_preview',
-    'parse_split_csv',
-    'calculate_summary_stats',
-    'transform_to_multiindex'
-]
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
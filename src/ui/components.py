@@ -3,8 +3,10 @@ Streamlit UI components
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
 import logging
+from functools import lru_cache
 from pathlib import Path
 from calendar import month_name
 
@@ -34,56 +36,69 @@ def show_config_error(error_msg: str):
     st.stop()
 
 
-def _display_dataframe_with_styling(df: pd.DataFrame, project_col, is_multilevel: bool = False):
-    """Helper to display dataframe with TOTAL row styling"""
-    
-    def highlight_total(row):
-        try:
-            return ['background-color: #f0f2f6; font-weight: bold' if row.get(project_col) == 'TOTAL' else '' for _ in row]
-        except:
-            return ['' for _ in row]
-    
-    def format_number(val):
-        if val is None or val == '' or val == '-':
-            return '-'
-        try:
-            return f'{float(val):.1f}'
-        except (ValueError, TypeError):
-            return str(val)
-    
-    # Build format dict based on column type
+def _numeric_columns(columns, is_multilevel: bool = False) -> list:
+    """Return the hour columns, i.e. everything except Project and Component"""
     if is_multilevel:
-        format_dict = {col: format_number for col in df.columns 
-                      if not str(col[0]).startswith('Project') and not str(col[1]).startswith('Component')}
+        # Weekly labels sit on the second level: ('', 'Project'), ('', 'Component')
+        return [col for col in columns
+                if not str(col[1]).startswith('Project') and not str(col[1]).startswith('Component')]
+    return [col for col in columns
+            if not str(col).startswith('Project') and not str(col).startswith('Component')]
+
+
+_TOTAL_ROW_STYLE = 'background-color: #f0f2f6; font-weight: bold'
+
+
+def _highlight_total_rows(df: pd.DataFrame, project_col) -> pd.DataFrame:
+    """Build the cell styles for Styler.apply(axis=None), highlighting TOTAL rows"""
+    if project_col in df.columns:
+        is_total = (df[project_col] == 'TOTAL').to_numpy()
     else:
-        format_dict = {col: format_number for col in df.columns 
-                      if not str(col).startswith('Project') and not str(col).startswith('Component')}
-    
-    
-    # Create column config to pin Project and Component columns
-    column_config = {}
+        is_total = np.zeros(len(df), dtype=bool)
+    mask = np.broadcast_to(is_total[:, None], df.shape)
+    return pd.DataFrame(np.where(mask, _TOTAL_ROW_STYLE, ''), index=df.index, columns=df.columns)
+
+
+# Pinned column configs keyed by (is_multilevel, index levels, pinned column names)
+_COLUMN_CONFIG_CACHE: dict = {}
+
+
+def _pinned_column_config(df: pd.DataFrame, is_multilevel: bool = False):
+    """Return the st.dataframe column_config pinning Project and Component, or None"""
     if is_multilevel:
         # For MultiIndex columns, use integer indices
         # Note: Must account for DataFrame index levels even with hide_index=True
         # Index 0 is the hidden index, so Project=1, Component=2
         num_index_levels = df.index.nlevels
-        column_config[num_index_levels] = st.column_config.Column(pinned=True)  # Project
-        column_config[num_index_levels + 1] = st.column_config.Column(pinned=True)  # Component
+        key = (True, num_index_levels, ())
+        pinned = (num_index_levels, num_index_levels + 1)
     else:
         # Find the actual column names for Project and Component
-        project_cols = [col for col in df.columns if str(col).startswith('Project')]
-        component_cols = [col for col in df.columns if str(col).startswith('Component')]
-        if project_cols:
-            column_config[project_cols[0]] = st.column_config.Column(pinned=True)
-        if component_cols:
-            column_config[component_cols[0]] = st.column_config.Column(pinned=True)
+        project_col = next((col for col in df.columns if str(col).startswith('Project')), None)
+        component_col = next((col for col in df.columns if str(col).startswith('Component')), None)
+        pinned = tuple(col for col in (project_col, component_col) if col is not None)
+        key = (False, 0, pinned)
+    
+    if key not in _COLUMN_CONFIG_CACHE:
+        _COLUMN_CONFIG_CACHE[key] = {col: st.column_config.Column(pinned=True) for col in pinned} or None
+    return _COLUMN_CONFIG_CACHE[key]
+
+
+def _display_dataframe_with_styling(df: pd.DataFrame, project_col, is_multilevel: bool = False):
+    """Helper to display dataframe with TOTAL row styling"""
+    
+    # Hour columns are float64 (see _build_section_df), so one vectorized format covers them
+    numeric_cols = _numeric_columns(df.columns, is_multilevel)
+    
+    # Pin Project and Component columns
+    column_config = _pinned_column_config(df, is_multilevel)
     
     try:
-        styled_df = df.style.apply(highlight_total, axis=1).format(format_dict)
-        st.dataframe(styled_df, use_container_width=True, hide_index=True, height=250, column_config=column_config if column_config else None)
+        styled_df = df.style.apply(_highlight_total_rows, axis=None, project_col=project_col).format('{:.1f}', subset=numeric_cols, na_rep='-')
+        st.dataframe(styled_df, use_container_width=True, hide_index=True, height=250, column_config=column_config)
     except Exception:
         # Fallback: display without styling
-        st.dataframe(df, use_container_width=True, hide_index=True, height=250, column_config=column_config if column_config else None)
+        st.dataframe(df, use_container_width=True, hide_index=True, height=250, column_config=column_config)
 
 
 def _parse_xlsx_sheet(ws, is_multilevel: bool = False):
@@ -100,8 +115,9 @@ def _parse_xlsx_sheet(ws, is_multilevel: bool = False):
     metadata = {}
     
     for row in ws.iter_rows(values_only=True):
-        # Skip empty rows
-        if not any(row):
+        # Skip rows without a first cell - every section, header, data and
+        # TOTAL row starts in column A, so there is no need to scan the rest
+        if not row or row[0] is None:
             continue
         
         # Parse metadata lines (before sections start)
@@ -144,8 +160,31 @@ def _parse_xlsx_sheet(ws, is_multilevel: bool = False):
     return dev_data, maint_data, header_row, header_row_2, metadata
 
 
-def _create_multilevel_columns():
-    """Create multi-level column headers for weekly breakdown"""
+@st.cache_data(show_spinner=False)
+def _parse_xlsx_workbook_cached(xlsx_path: str, mtime: float, is_multilevel: bool = False):
+    """Parse every sheet of an XLSX report in one pass, cached until the file changes
+    
+    mtime is only part of the cache key so a regenerated report is re-parsed.
+    
+    Returns:
+        dict: sheet name -> _parse_xlsx_sheet result, in workbook order
+    """
+    from openpyxl import load_workbook
+    
+    # Read-only mode streams rows without building Cell objects; the sheets are never modified
+    wb = load_workbook(xlsx_path, read_only=True, data_only=True)
+    try:
+        return {name: _parse_xlsx_sheet(wb[name], is_multilevel) for name in wb.sheetnames}
+    finally:
+        wb.close()
+
+
+@lru_cache(maxsize=1)
+def _create_multilevel_columns() -> tuple:
+    """Create multi-level column headers for weekly breakdown
+    
+    The layout is fixed, so it is built once and returned as a tuple of tuples.
+    """
     month_names_short = [month_name[i][:3] for i in range(1, 13)]
     
     multi_columns = []
@@ -158,7 +197,7 @@ def _create_multilevel_columns():
             multi_columns.append((month_abbr, f'W{week}'))
     
     multi_columns.append(('', 'Total'))
-    return multi_columns
+    return tuple(multi_columns)
 
 
 def _create_single_level_columns(header_row):
@@ -180,6 +219,26 @@ def _create_single_level_columns(header_row):
     return unique_headers
 
 
+def _build_section_df(rows: list, header_row, is_multilevel: bool = False):
+    """Build a section DataFrame with float64 hour columns
+    
+    Returns:
+        tuple: (DataFrame, project column label)
+    """
+    if is_multilevel:
+        columns = pd.MultiIndex.from_tuples(_create_multilevel_columns())
+        project_col = ('', 'Project')
+    else:
+        columns = _create_single_level_columns(header_row)
+        project_col = next((c for c in columns if str(c).startswith('Project')), 'Project')
+    
+    # Empty or placeholder hour cells (None, '-') are coerced to NaN so the column stays float64
+    df = pd.DataFrame.from_records(rows, columns=columns)
+    for col in _numeric_columns(df.columns, is_multilevel):
+        df[col] = pd.to_numeric(df[col], errors='coerce')
+    return df, project_col
+
+
 def _display_metadata_info(metadata: dict):
     """Display metadata information in a consistent format"""
     if not metadata or 'generated' not in metadata:
@@ -193,10 +252,11 @@ def _display_metadata_info(metadata: dict):
 def display_monthly_breakdown_preview(xlsx_path: Path, report_type: str = "monthly"):
     """Display monthly/weekly breakdown preview with team member selector"""
     try:
-        from openpyxl import load_workbook
-        
-        wb = load_workbook(xlsx_path, read_only=False)
-        sheet_names = wb.sheetnames
+        # All sheets are parsed on first render; switching members is then a dict lookup
+        is_multilevel = report_type == "weekly"
+        mtime = xlsx_path.stat().st_mtime
+        parsed_sheets = _parse_xlsx_workbook_cached(str(xlsx_path), mtime, is_multilevel)
+        sheet_names = list(parsed_sheets)
         
         if not sheet_names:
             st.warning("No data found in the report")
@@ -210,49 +270,25 @@ def display_monthly_breakdown_preview(xlsx_path: Path, report_type: str = "month
             help=f"Choose a team member to view their {breakdown_type} breakdown"
         )
         
-        # Read the selected sheet
-        ws = wb[selected_member]
-        is_multilevel = report_type == "weekly"
-        
-        # Parse sections with metadata
-        dev_data, maint_data, header_row, header_row_2, metadata = _parse_xlsx_sheet(ws, is_multilevel)
+        # Parsed sections with metadata
+        dev_data, maint_data, header_row, header_row_2, metadata = parsed_sheets[selected_member]
         
         # Display metadata
         _display_metadata_info(metadata)
         
+        use_multilevel = bool(is_multilevel and header_row_2)
+        
         # Display Development table
         if dev_data and header_row:
             st.markdown("### :wrench: Development")
-            
-            if is_multilevel and header_row_2:
-                multi_columns = _create_multilevel_columns()
-                dev_df = pd.DataFrame(dev_data)
-                dev_df.columns = pd.MultiIndex.from_tuples(multi_columns)
-                project_col = ('', 'Project')
-            else:
-                unique_headers = _create_single_level_columns(header_row)
-                dev_df = pd.DataFrame(dev_data, columns=unique_headers)
-                project_col = next((c for c in dev_df.columns if str(c).startswith('Project')), 'Project')
-            
-            _display_dataframe_with_styling(dev_df, project_col, is_multilevel and header_row_2)
+            dev_df, project_col = _build_section_df(dev_data, header_row, use_multilevel)
+            _display_dataframe_with_styling(dev_df, project_col, use_multilevel)
         
         # Display Maintenance table
         if maint_data and header_row:
             st.markdown("### :hammer_and_wrench: Maintenance")
-            
-            if is_multilevel and header_row_2:
-                multi_columns = _create_multilevel_columns()
-                maint_df = pd.DataFrame(maint_data)
-                maint_df.columns = pd.MultiIndex.from_tuples(multi_columns)
-                project_col = ('', 'Project')
-            else:
-                unique_headers = _create_single_level_columns(header_row)
-                maint_df = pd.DataFrame(maint_data, columns=unique_headers)
-                project_col = next((c for c in maint_df.columns if str(c).startswith('Project')), 'Project')
-            
-            _display_dataframe_with_styling(maint_df, project_col, is_multilevel and header_row_2)
-        
-        wb.close()
+            maint_df, project_col = _build_section_df(maint_data, header_row, use_multilevel)
+            _display_dataframe_with_styling(maint_df, project_col, use_multilevel)
         
     except Exception as e:
         st.warning(f"Could not display monthly breakdown preview: {e}")
@@ -272,7 +308,7 @@ def display_report_preview(result_path: Path, csv_data: bytes, report_type: str
     st.subheader(f":clipboard: Report Preview - {report_type_display}")
     
     # For monthly or weekly breakdown, show XLSX preview with team member selector
-    if report_type in ["monthly", "weekly"] and xlsx_path and Path(xlsx_path).exists():
+    if report_type in ["monthly", "weekly"] and xlsx_path and xlsx_path.exists():
         display_monthly_breakdown_preview(xlsx_path, report_type)
         return
     
@@ -282,39 +318,27 @@ def display_report_preview(result_path: Path, csv_data: bytes, report_type: str
         
         # Display metadata using shared function
         _display_metadata_info(metadata)
-        stats = calculate_summary_stats(dev_df, maint_df)
+        stats = calculate_summary_stats(dev_df, maint_df, report_type)
         
-        # Display summary metrics in two rows
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Projects", stats['projects'])
-        with col2:
-            st.metric("Components", stats['components'])
-        with col3:
-            st.metric("Team Members", stats['team_members'])
-        
-        # Display hours breakdown in one row
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric("Development Hours", f"{stats['dev_hours']:.1f}h")
-        with col2:
-            st.metric("Maintenance Hours", f"{stats['maint_hours']:.1f}h")
-        with col3:
-            st.metric("Total Hours", f"{stats['total_hours']:.1f}h")
+        # Display summary counts and hours breakdown in a single row
+        metrics = [
+            ("Projects", stats['projects']),
+            ("Components", stats['components']),
+            ("Team Members", stats['team_members']),
+            ("Development Hours", f"{stats['dev_hours']:.1f}h"),
+            ("Maintenance Hours", f"{stats['maint_hours']:.1f}h"),
+            ("Total Hours", f"{stats['total_hours']:.1f}h"),
+        ]
+        for col, (label, value) in zip(st.columns(len(metrics)), metrics):
+            col.metric(label, value)
         
         # Display Development table
         if not dev_df.empty:
             st.markdown("### :wrench: Development")
             dev_display = transform_to_multiindex(dev_df)
             
-            def highlight_total(row):
-                if isinstance(dev_display.columns, pd.MultiIndex):
-                    is_total = row[('', 'Project')] == 'TOTAL'
-                else:
-                    is_total = row['Project'] == 'TOTAL'
-                return ['background-color: #f0f2f6; font-weight: bold' if is_total else '' for _ in row]
-            
-            styled_dev = dev_display.style.apply(highlight_total, axis=1)
+            project_col = ('', 'Project') if isinstance(dev_display.columns, pd.MultiIndex) else 'Project'
+            styled_dev = dev_display.style.apply(_highlight_total_rows, axis=None, project_col=project_col)
             
             # Format numeric columns
             if isinstance(dev_display.columns, pd.MultiIndex):
@@ -324,33 +348,18 @@ def display_report_preview(result_path: Path, csv_data: bytes, report_type: str
             
             styled_dev = styled_dev.format(format_dict, na_rep='-')
             
-            # Create column config to pin Project and Component columns
-            column_config = {}
-            if isinstance(dev_display.columns, pd.MultiIndex):
-                # For MultiIndex columns, use integer indices
-                # Must account for DataFrame index levels even with hide_index=True
-                num_index_levels = dev_display.index.nlevels
-                column_config[num_index_levels] = st.column_config.Column(pinned=True)  # Project
-                column_config[num_index_levels + 1] = st.column_config.Column(pinned=True)  # Component
-            else:
-                column_config['Project'] = st.column_config.Column(pinned=True)
-                column_config['Component'] = st.column_config.Column(pinned=True)
-                        
-            st.dataframe(styled_dev, use_container_width=True, hide_index=True, height=300, column_config=column_config if column_config else None)
+            # Pin Project and Component columns
+            column_config = _pinned_column_config(dev_display, isinstance(dev_display.columns, pd.MultiIndex))
+            
+            st.dataframe(styled_dev, use_container_width=True, hide_index=True, height=300, column_config=column_config)
         
         # Display Maintenance table
         if not maint_df.empty:
             st.markdown("### :hammer_and_wrench: Maintenance")
             maint_display = transform_to_multiindex(maint_df)
             
-            def highlight_total(row):
-                if isinstance(maint_display.columns, pd.MultiIndex):
-                    is_total = row[('', 'Project')] == 'TOTAL'
-                else:
-                    is_total = row['Project'] == 'TOTAL'
-                return ['background-color: #f0f2f6; font-weight: bold' if is_total else '' for _ in row]
-            
-            styled_maint = maint_display.style.apply(highlight_total, axis=1)
+            project_col = ('', 'Project') if isinstance(maint_display.columns, pd.MultiIndex) else 'Project'
+            styled_maint = maint_display.style.apply(_highlight_total_rows, axis=None, project_col=project_col)
             
             # Format numeric columns
             if isinstance(maint_display.columns, pd.MultiIndex):
@@ -360,19 +369,10 @@ def display_report_preview(result_path: Path, csv_data: bytes, report_type: str
             
             styled_maint = styled_maint.format(format_dict, na_rep='-')
             
-            # Create column config to pin Project and Component columns
-            column_config = {}
-            if isinstance(maint_display.columns, pd.MultiIndex):
-                # For MultiIndex columns, use integer indices
-                # Must account for DataFrame index levels even with hide_index=True
-                num_index_levels = maint_display.index.nlevels
-                column_config[num_index_levels] = st.column_config.Column(pinned=True)  # Project
-                column_config[num_index_levels + 1] = st.column_config.Column(pinned=True)  # Component
-            else:
-                column_config['Project'] = st.column_config.Column(pinned=True)
-                column_config['Component'] = st.column_config.Column(pinned=True)
-                        
-            st.dataframe(styled_maint, use_container_width=True, hide_index=True, height=300, column_config=column_config if column_config else None)
+            # Pin Project and Component columns
+            column_config = _pinned_column_config(maint_display, isinstance(maint_display.columns, pd.MultiIndex))
+            
+            st.dataframe(styled_maint, use_container_width=True, hide_index=True, height=300, column_config=column_config)
         
     except Exception as e:
         st.warning(f"Could not display preview: {e}")
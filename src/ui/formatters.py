@@ -2,72 +2,152 @@
 Data formatting utilities for UI display
 """
 
+import mmap
+import os
+import re
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 from pathlib import Path
-from io import StringIO
+from io import BytesIO
+from typing import Optional
+
+try:
+    import pyarrow  # noqa: F401 - only needed for pandas' pyarrow CSV engine
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Below this size the pyarrow reader's thread pool costs more than it saves
+_PYARROW_MIN_BYTES = 4096
+
+_GENERATED_PREFIX = b'Generated:'
+# Quarterly member columns, e.g. "Jane Doe Q1"
+_Q_RE = re.compile(r'^(.*) (Q[1-4])$')
+
+
+def _find_line(buf, marker: bytes, start: int = 0):
+    """Find a line consisting of exactly ``marker`` (\n or \r\n terminated)
+    
+    Returns:
+        tuple: (line start, start of the following line), or None if absent
+    """
+    pos = start
+    while True:
+        idx = buf.find(marker, pos)
+        if idx < 0:
+            return None
+        end = idx + len(marker)
+        if idx == 0 or buf[idx - 1:idx] == b'\n':
+            if end == len(buf):
+                return idx, end
+            if buf[end:end + 1] == b'\n':
+                return idx, end + 1
+            if buf[end:end + 2] == b'\r\n':
+                return idx, end + 2
+        pos = end
+
+
+def _read_section(block: bytes) -> pd.DataFrame:
+    """Parse one section's CSV bytes (blank lines are skipped by both engines)
+    
+    Large sections use pandas' multithreaded pyarrow engine when pyarrow is
+    installed; columns stay NumPy-backed so downstream dtype checks still apply.
+    """
+    if not block.strip():
+        return pd.DataFrame()
+    engine = 'pyarrow' if PYARROW_AVAILABLE and len(block) >= _PYARROW_MIN_BYTES else 'c'
+    return pd.read_csv(BytesIO(block), engine=engine)
 
 
 def parse_split_csv(file_path: Path) -> tuple:
     """Parse CSV file split by Development and Maintenance sections
     
+    Results are cached per (path, mtime, size), so Streamlit reruns over the
+    same report skip the parse entirely. The returned DataFrames are shared
+    between calls and must not be modified in place.
+    
     Returns:
         tuple: (dev_df, maint_df, metadata_dict)
     """
-    with open(file_path, 'r', encoding='utf-8') as f:
-        lines = f.readlines()
+    stat = os.stat(file_path)
+    return _parse_split_csv_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _parse_split_csv_cached(file_path: str, mtime_ns: int, size: int) -> tuple:
+    """Parse a split CSV file; mtime_ns and size only key the cache
     
-    dev_lines = []
-    maint_lines = []
-    current_section = None
+    The file is memory-mapped rather than read line by line; the two section
+    markers are located with plain substring searches over the mapping and
+    only each section's bytes are copied out for pandas' CSV parser.
+    """
     metadata = {}
+    blocks = {}
     
-    for line in lines:
-        stripped = line.strip()
-        
-        # Parse metadata lines
-        if stripped.startswith('Generated:'):
-            metadata['generated'] = stripped.replace('Generated:', '').strip()
-            continue
-        
-        if stripped == 'DEVELOPMENT':
-            current_section = 'dev'
-            continue
-        elif stripped == 'MAINTENANCE':
-            current_section = 'maint'
-            continue
-        elif not stripped:
-            continue
+    with open(file_path, 'rb') as f:
+        # mmap cannot map an empty file
+        if os.fstat(f.fileno()).st_size == 0:
+            return pd.DataFrame(), pd.DataFrame(), metadata
         
-        if current_section == 'dev':
-            dev_lines.append(line)
-        elif current_section == 'maint':
-            maint_lines.append(line)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # The exporters write: metadata, DEVELOPMENT section, MAINTENANCE section
+            dev = _find_line(mm, b'DEVELOPMENT')
+            maint = _find_line(mm, b'MAINTENANCE', dev[1] if dev else 0)
+            header_end = (dev or maint or (len(mm),))[0]
+            
+            # Metadata lines only appear before the first section
+            generated = mm.find(_GENERATED_PREFIX, 0, header_end)
+            if generated >= 0 and (generated == 0 or mm[generated - 1:generated] == b'\n'):
+                line_end = mm.find(b'\n', generated, header_end)
+                value = mm[generated + len(_GENERATED_PREFIX):line_end if line_end >= 0 else header_end]
+                metadata['generated'] = value.decode('utf-8').strip()
+            
+            if dev:
+                blocks[b'DEVELOPMENT'] = mm[dev[1]:maint[0] if maint else len(mm)]
+            if maint:
+                blocks[b'MAINTENANCE'] = mm[maint[1]:]
     
     # Parse into DataFrames
-    dev_df = pd.read_csv(StringIO(''.join(dev_lines))) if dev_lines else pd.DataFrame()
-    maint_df = pd.read_csv(StringIO(''.join(maint_lines))) if maint_lines else pd.DataFrame()
+    dev_df = _read_section(blocks.get(b'DEVELOPMENT', b''))
+    maint_df = _read_section(blocks.get(b'MAINTENANCE', b''))
     
     return dev_df, maint_df, metadata
 
 
-def calculate_summary_stats(dev_df: pd.DataFrame, maint_df: pd.DataFrame) -> dict:
-    """Calculate summary statistics from both Development and Maintenance DataFrames"""
+# Hour columns per team member for report kinds whose CSV layout is known
+_MEMBER_COLUMNS_PER_KIND = {'yearly': 1, 'quarterly': 4}
+
+
+def calculate_summary_stats(dev_df: pd.DataFrame, maint_df: pd.DataFrame, report_kind: Optional[str] = None) -> dict:
+    """Calculate summary statistics from both Development and Maintenance DataFrames
+    
+    Args:
+        report_kind: 'yearly' or 'quarterly' fixes the number of columns per team
+            member; otherwise it is detected from the column names
+    """
     
     def get_stats_from_df(df):
         if df.empty:
             return 0, 0, 0
-        data_df = df[df['Project'].notna() & (df['Project'] != 'TOTAL')]
-        projects = data_df['Project'].nunique() if 'Project' in data_df.columns else 0
-        components = data_df['Component'].nunique() if 'Component' in data_df.columns else 0
+        # Compare on the column's own array so string dtypes (Arrow-backed when
+        # pyarrow is installed) use their vectorized kernels, not object compares
+        project = df['Project']
+        is_total = (project == 'TOTAL').to_numpy(dtype=bool, na_value=False)
+        is_data = ~is_total & project.notna().to_numpy()
+        # Distinct counts via pandas' hash table over the masked arrays, no sort
+        projects = pd.unique(project.array[is_data]).size
+        components = 0
+        if 'Component' in df.columns:
+            component = df['Component']
+            components = pd.unique(component.array[is_data & component.notna().to_numpy()]).size
         
-        # Get total hours from TOTAL row
-        total_row = df[df['Project'] == 'TOTAL']
-        if not total_row.empty:
-            numeric_cols = total_row.select_dtypes(include=['float64', 'int64']).columns
-            hours = total_row[numeric_cols].sum().sum()
-        else:
-            numeric_cols = data_df.select_dtypes(include=['float64', 'int64']).columns
-            hours = data_df[numeric_cols].sum().sum()
+        # Get total hours from TOTAL row, falling back to the data rows
+        numeric_cols = df.select_dtypes(include=['float64', 'int64']).columns
+        hours_rows = is_total if is_total.any() else is_data
+        # Empty cells become 0.0 during extraction, so the sum is one plain float64 reduction
+        values = df[numeric_cols].to_numpy(dtype=np.float64, na_value=0.0)
+        hours = values[hours_rows].sum()
         
         return projects, components, hours
     
@@ -76,21 +156,15 @@ def calculate_summary_stats(dev_df: pd.DataFrame, maint_df: pd.DataFrame) -> dic
     
     # Team members count - for quarterly reports, divide by 4 (Q1-Q4 per member)
     team_members = 0
-    if not dev_df.empty:
-        # Check if this is a quarterly report (columns end with Q1, Q2, Q3, Q4)
-        cols = [c for c in dev_df.columns if c not in ['Project', 'Component']]
-        if cols and any('Q' in str(col) for col in cols):
-            # Quarterly report: each member has 4 columns (Q1-Q4)
-            team_members = len(cols) // 4
-        else:
-            # Yearly report: one column per member
-            team_members = len(cols)
-    elif not maint_df.empty:
-        cols = [c for c in maint_df.columns if c not in ['Project', 'Component']]
-        if cols and any('Q' in str(col) for col in cols):
-            team_members = len(cols) // 4
-        else:
-            team_members = len(cols)
+    source_df = dev_df if not dev_df.empty else maint_df
+    if not source_df.empty:
+        columns = source_df.columns
+        num_member_cols = len(columns) - int(columns.isin(['Project', 'Component']).sum())
+        per_member = _MEMBER_COLUMNS_PER_KIND.get(report_kind)
+        if per_member is None:
+            # Unknown kind: quarterly columns end with Q1-Q4, yearly has one per member
+            per_member = 4 if columns.astype(str).str.contains('Q', regex=False).any() else 1
+        team_members = num_member_cols // per_member
     
     return {
         'projects': max(dev_projects, maint_projects),
@@ -117,16 +191,12 @@ def transform_to_multiindex(df: pd.DataFrame) -> pd.DataFrame:
     
     for col in cols:
         # Parse "Name Q1" format
-        if ' Q' in col:
-            parts = col.rsplit(' Q', 1)
-            name = parts[0]
-            quarter = f'Q{parts[1]}'
-            new_columns.append((name, quarter))
-        else:
-            new_columns.append(('', col))
-    
-    # Create new dataframe with multi-level columns
-    df_multi = df.copy()
+        match = _Q_RE.match(str(col))
+        new_columns.append(match.groups() if match else ('', col))
+    
+    # Relabel a shallow copy - only the column labels change, so the value
+    # blocks are shared with the input (callers only read it for display)
+    df_multi = df.copy(deep=False)
     df_multi.columns = pd.MultiIndex.from_tuples(new_columns)
     
     return df_multi
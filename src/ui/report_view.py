@@ -1,29 +1,36 @@
 import streamlit as st
 from pathlib import Path
+from typing import Optional
 from . import display_report_preview
 
-def display_download_buttons(csv_path: str, xlsx_path: str, csv_data: bytes, report_type: str):
+
+@st.cache_data(show_spinner=False)
+def _load_file_bytes(path: str, mtime_ns: int) -> bytes:
+    """Read a report file, cached across reruns until it is rewritten"""
+    return Path(path).read_bytes()
+
+
+def display_download_buttons(csv_path: Path, xlsx_path: Optional[Path], csv_data: bytes, report_type: str):
     """Display download buttons based on report type"""
     has_xlsx = report_type in ["Quarterly Breakdown", "Monthly Breakdown", "Weekly Breakdown"]
     
-    if has_xlsx and xlsx_path and Path(xlsx_path).exists():
+    if has_xlsx and xlsx_path and xlsx_path.exists():
         col1, col2 = st.columns(2)
         with col1:
             st.download_button(
                 label=":inbox_tray: Download CSV",
                 data=csv_data,
-                file_name=Path(csv_path).name,
+                file_name=csv_path.name,
                 mime="text/csv",
                 use_container_width=True,
                 key="download_csv"
             )
         with col2:
-            with open(xlsx_path, 'rb') as f:
-                xlsx_data = f.read()
+            xlsx_data = _load_file_bytes(str(xlsx_path), xlsx_path.stat().st_mtime_ns)
             st.download_button(
                 label=":inbox_tray: Download XLSX (Formatted)",
                 data=xlsx_data,
-                file_name=Path(xlsx_path).name,
+                file_name=xlsx_path.name,
                 mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                 use_container_width=True,
                 key="download_xlsx"
@@ -32,7 +39,7 @@ def display_download_buttons(csv_path: str, xlsx_path: str, csv_data: bytes, rep
         st.download_button(
             label=":inbox_tray: Download CSV Report",
             data=csv_data,
-            file_name=Path(csv_path).name,
+            file_name=csv_path.name,
             mime="text/csv",
             use_container_width=True,
             key="download_csv"
@@ -50,7 +57,7 @@ def display_stored_report():
     report_type = st.session_state.report_type
     
     # Only display if file exists
-    if not Path(csv_path).exists():
+    if not csv_path.exists():
         return
     
     # Show download buttons
@@ -65,6 +72,6 @@ def display_stored_report():
     }
     
     preview_type = report_type_map.get(report_type, "yearly")
-    xlsx_path_obj = Path(xlsx_path) if xlsx_path else None
     
-    display_report_preview(Path(csv_path), csv_data, preview_type, xlsx_path_obj)
+    # Paths are stored as Path objects when the report is generated
+    display_report_preview(csv_path, csv_data, preview_type, xlsx_path)
@@ -1,9 +1,11 @@
-import streamlit as st
 from datetime import datetime
 from typing import Tuple
 
+
 def render_sidebar() -> Tuple[str, int, int, bool, bool]:
     """Render sidebar configuration and return settings"""
+    import streamlit as st
+    
     st.sidebar.header(":gear: Configuration")
     
     # Report type selector
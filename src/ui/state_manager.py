@@ -1,14 +1,16 @@
-import streamlit as st
+# Session state keys and their initial values
+_SESSION_DEFAULTS = {
+    'report_generated': False,
+    'csv_path': None,
+    'xlsx_path': None,
+    'report_type': None,
+    'csv_data': None,
+}
+
 
 def initialize_session_state():
     """Initialize session state variables"""
-    if 'report_generated' not in st.session_state:
-        st.session_state.report_generated = False
-    if 'csv_path' not in st.session_state:
-        st.session_state.csv_path = None
-    if 'xlsx_path' not in st.session_state:
-        st.session_state.xlsx_path = None
-    if 'report_type' not in st.session_state:
-        st.session_state.report_type = None
-    if 'csv_data' not in st.session_state:
-        st.session_state.csv_data = None
+    import streamlit as st
+    
+    for key, value in _SESSION_DEFAULTS.items():
+        st.session_state.setdefault(key, value)
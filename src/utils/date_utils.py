@@ -3,14 +3,18 @@ Date utility functions
 """
 
 from datetime import datetime, timedelta, timezone
-from typing import Tuple
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+import numpy as np
 
 # Malaysia timezone (UTC+8)
 MALAYSIA_TZ = timezone(timedelta(hours=8))
 
 
+@lru_cache(maxsize=512)
 def get_month_range(year: int, month: int) -> Tuple[datetime, datetime]:
-    """Get start and end datetime for a month (timezone-aware UTC)"""
+    """Get start and end datetime for a month (timezone-aware UTC, cached)"""
     start_date = datetime(year, month, 1, tzinfo=timezone.utc)
     
     if month == 12:
@@ -24,19 +28,59 @@ def get_month_range(year: int, month: int) -> Tuple[datetime, datetime]:
     return start_date, end_date
 
 
+@lru_cache(maxsize=64)
 def get_year_range(year: int) -> Tuple[datetime, datetime]:
-    """Get start and end datetime for a year (timezone-aware UTC)"""
+    """Get start and end datetime for a year (timezone-aware UTC, cached)"""
     start_date = datetime(year, 1, 1, tzinfo=timezone.utc)
     end_date = datetime(year, 12, 31, 23, 59, 59, tzinfo=timezone.utc)
     return start_date, end_date
 
 
 def format_date_for_jql(dt: datetime) -> str:
-    """Format datetime for JQL query"""
-    return dt.strftime('%Y-%m-%d')
+    """Format datetime for JQL query (YYYY-MM-DD)"""
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+
+
+def parse_jira_datetime(value: str) -> datetime:
+    """Parse a Jira timestamp such as 2025-01-15T09:00:00.000+0000
+    
+    datetime.fromisoformat only accepts a colon-less UTC offset from Python 3.11,
+    so the offset (or a trailing Z) is rewritten as +HH:MM first.
+    """
+    if value.endswith('Z'):
+        value = value[:-1] + '+00:00'
+    elif len(value) > 5 and value[-5] in '+-' and value[-4:].isdigit():
+        value = f"{value[:-2]}:{value[-2:]}"
+    return datetime.fromisoformat(value)
+
+
+def to_datetime64(dt: datetime) -> np.datetime64:
+    """Convert a datetime to numpy datetime64[us] (aware datetimes are normalized to UTC)"""
+    if dt.tzinfo is not None:
+        dt = dt.astimezone(timezone.utc).replace(tzinfo=None)
+    return np.datetime64(dt, 'us')
+
+
+def split_wall_clock(dates: Sequence[datetime]) -> Tuple[np.ndarray, np.ndarray]:
+    """Split datetimes into wall-clock datetime64[us] and UTC offset timedelta64[us] columns
+    
+    ``wall_clock - offsets`` gives the UTC column with one vectorized
+    subtraction instead of converting each datetime.
+    """
+    wall_clock = np.array([dt.replace(tzinfo=None) for dt in dates], dtype='datetime64[us]')
+    offsets = np.array([dt.utcoffset() or timedelta(0) for dt in dates], dtype='timedelta64[us]')
+    return wall_clock, offsets
+
+
+def get_week_numbers(wall_clock: np.ndarray) -> np.ndarray:
+    """Get week numbers within month (1-5) for a datetime64 column, as int8"""
+    day_of_month = (wall_clock.astype('datetime64[D]') - wall_clock.astype('datetime64[M]')).astype(np.int64) + 1
+    return ((day_of_month - 1) // 7 + 1).astype(np.int8)
 
 
 def get_week_number(date: datetime) -> int:
-    """Get week number within month (1-5)"""
-    week = ((date.day - 1) // 7) + 1
-    return min(week, 5)
+    """Get week number within month (1-5)
+    
+    Days 29-31 give (day - 1) // 7 == 4, so the result never exceeds 5.
+    """
+    return (date.day - 1) // 7 + 1
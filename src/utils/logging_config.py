@@ -4,6 +4,7 @@ Logging configuration
 
 import logging
 import sys
+from logging.handlers import MemoryHandler, RotatingFileHandler
 from pathlib import Path
 
 
@@ -30,8 +31,14 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
     
-    # Remove existing handlers
-    root_logger.handlers = []
+    # Remove and close existing handlers so repeated calls do not leak files;
+    # MemoryHandler.close() flushes its buffer but leaves its target open
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+        target = handler.target if isinstance(handler, MemoryHandler) else None
+        handler.close()
+        if target is not None:
+            target.close()
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -39,13 +46,21 @@ def setup_logging(
     console_handler.setFormatter(formatter)
     root_logger.addHandler(console_handler)
     
-    # File handler (optional)
+    # File handler (optional) - opened on first write, and fed through a
+    # buffer so records hit the disk in batches (flushed early on errors;
+    # logging's shutdown hook flushes whatever is left at exit)
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_file)
+        file_handler = RotatingFileHandler(
+            log_file, maxBytes=10 * 1024 * 1024, backupCount=3, delay=True
+        )
         file_handler.setLevel(log_level)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        buffered_handler = MemoryHandler(
+            capacity=1000, flushLevel=logging.ERROR, target=file_handler
+        )
+        buffered_handler.setLevel(log_level)
+        root_logger.addHandler(buffered_handler)
     
     # Reduce noise from requests library
     logging.getLogger('urllib3').setLevel(logging.WARNING)
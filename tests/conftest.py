@@ -0,0 +1,25 @@
+"""
+Shared pytest configuration
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Make the repository root importable once for every test module
+ROOT_DIR = str(Path(__file__).parent.parent)
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+
+@pytest.fixture(scope="session")
+def jira_config():
+    """Valid Jira configuration shared by the whole session; treat it as read-only"""
+    from src.config import JiraConfig
+    return JiraConfig(
+        url="https://test.atlassian.net",
+        username="test@example.com",
+        api_token="test-token-123456",
+        project_keys=["TEST"]
+    )
@@ -3,15 +3,15 @@
 Benchmark script to compare performance with/without optimizations
 """
 
+import shutil
 import sys
+import tempfile
 import time
 from pathlib import Path
 
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from src.config import Config
 from src.report_generator import generate_csv_report
+from scripts.clear_cache import clear_cache
 
 
 def benchmark():
@@ -25,12 +25,15 @@ def benchmark():
     config = Config.from_env()
     year = 2025
     
+    # Write reports to a private directory so concurrent runs never share filenames
+    output_dir = Path(tempfile.mkdtemp(prefix="benchmark_"))
+    
     # Test 1: With cache disabled
     print("Test 1: Without cache (simulates first run)")
     print("-" * 70)
     config.jira.enable_cache = False
     start = time.time()
-    generate_csv_report(config, year=year, output_file="benchmark_nocache.csv")
+    generate_csv_report(config, year=year, output_file=str(output_dir / "benchmark_nocache.csv"))
     nocache_time = time.time() - start
     print(f"✓ Completed in {nocache_time:.1f}s")
     print()
@@ -41,7 +44,7 @@ def benchmark():
     clear_cache(config.jira.cache_dir)
     config.jira.enable_cache = True
     start = time.time()
-    generate_csv_report(config, year=year, output_file="benchmark_cache1.csv")
+    generate_csv_report(config, year=year, output_file=str(output_dir / "benchmark_cache1.csv"))
     cache1_time = time.time() - start
     print(f"✓ Completed in {cache1_time:.1f}s")
     print()
@@ -50,7 +53,7 @@ def benchmark():
     print("Test 3: With cache enabled (cached run)")
     print("-" * 70)
     start = time.time()
-    generate_csv_report(config, year=year, output_file="benchmark_cache2.csv")
+    generate_csv_report(config, year=year, output_file=str(output_dir / "benchmark_cache2.csv"))
     cache2_time = time.time() - start
     print(f"✓ Completed in {cache2_time:.1f}s")
     print()
@@ -68,9 +71,7 @@ def benchmark():
     print("=" * 70)
     
     # Cleanup
-    Path("benchmark_nocache.csv").unlink(missing_ok=True)
-    Path("benchmark_cache1.csv").unlink(missing_ok=True)
-    Path("benchmark_cache2.csv").unlink(missing_ok=True)
+    shutil.rmtree(output_dir, ignore_errors=True)
 
 
 if __name__ == "__main__":
@@ -3,11 +3,9 @@
 Quick test to verify cache is working
 """
 
-import sys
+import os
 from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent))
-
 from src.config import Config
 from src.jira_client import JiraClient
 
@@ -18,7 +16,7 @@ def test_cache():
     try:
         config = Config.from_env()
     except ValueError as e:
-        print(f"⚠️  Config error (expected if .env not set): {e}")
+        print(f"[WARN] Config error (expected if .env not set): {e}")
         print("Creating test config...")
         from src.config import JiraConfig, ReportConfig
         config = Config(
@@ -40,17 +38,21 @@ def test_cache():
     print(f"Cache directory: {config.jira.cache_dir}")
     print(f"Cache enabled: {config.jira.enable_cache}")
     
-    # Check if cache directory exists
+    # List cached files with a single directory scan (raises if the directory is missing)
     cache_path = Path(config.jira.cache_dir)
-    print(f"Cache path exists: {cache_path.exists()}")
+    try:
+        with os.scandir(cache_path) as entries:
+            cache_files = [e.name for e in entries if e.name.endswith('.json') and e.is_file()]
+    except FileNotFoundError:
+        cache_files = None
+    print(f"Cache path exists: {cache_files is not None}")
     
-    if cache_path.exists():
-        cache_files = list(cache_path.glob("*.json"))
+    if cache_files is not None:
         print(f"Cached files: {len(cache_files)}")
         if cache_files:
             print("Sample cache files:")
-            for f in cache_files[:5]:
-                print(f"  - {f.name}")
+            for name in cache_files[:5]:
+                print(f"  - {name}")
     
     # Initialize client
     client = JiraClient(
@@ -63,7 +65,7 @@ def test_cache():
     print(f"Client cache dir: {client.cache_dir}")
     print(f"Client cache dir exists: {client.cache_dir.exists()}")
     
-    print("\n✅ Cache configuration verified!")
+    print("\n[OK] Cache configuration verified!")
 
 if __name__ == "__main__":
     test_cache()
@@ -0,0 +1,33 @@
+"""
+Tests for the clear_cache script
+"""
+
+from scripts.clear_cache import clear_cache
+
+
+class TestClearCache:
+    """Test clearing the API cache directory"""
+
+    def test_clear_cache_removes_contents(self, tmp_path, capsys):
+        """Test files and subdirectories are removed but the directory is kept"""
+        (tmp_path / "a.json").write_text("{}")
+        (tmp_path / "nested").mkdir()
+        (tmp_path / "nested" / "b.json").write_text("{}")
+
+        clear_cache(str(tmp_path))
+
+        assert tmp_path.is_dir()
+        assert list(tmp_path.iterdir()) == []
+        out = capsys.readouterr().out
+        assert "Deleted: a.json" in out
+        assert "Deleted directory: nested" in out
+        assert "Cache cleared successfully" in out
+
+    def test_clear_cache_missing_directory(self, tmp_path, capsys):
+        """Test a missing cache directory is reported and left alone"""
+        missing = tmp_path / "missing"
+
+        clear_cache(str(missing))
+
+        assert not missing.exists()
+        assert "Cache directory does not exist" in capsys.readouterr().out
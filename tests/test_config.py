@@ -35,31 +35,27 @@ class TestJiraConfig:
             project_keys=["TEST"]
         )
         
-        assert config.validate() is True
+        config.validate()  # Construction already validated; re-checking does not raise
     
     def test_validate_invalid_url(self):
         """Test validation with invalid URL"""
-        config = JiraConfig(
-            url="invalid-url",
-            username="test@example.com",
-            api_token="test-token",
-            project_keys=["TEST"]
-        )
-        
         with pytest.raises(ValueError, match="Invalid JIRA_URL"):
-            config.validate()
+            JiraConfig(
+                url="invalid-url",
+                username="test@example.com",
+                api_token="test-token",
+                project_keys=["TEST"]
+            )
     
     def test_validate_invalid_username(self):
         """Test validation with invalid username"""
-        config = JiraConfig(
-            url="https://test.atlassian.net",
-            username="invalid",
-            api_token="test-token",
-            project_keys=["TEST"]
-        )
-        
         with pytest.raises(ValueError, match="Invalid JIRA_USERNAME"):
-            config.validate()
+            JiraConfig(
+                url="https://test.atlassian.net",
+                username="invalid",
+                api_token="test-token",
+                project_keys=["TEST"]
+            )
     
     def test_validate_no_project_keys(self):
         """Test validation with no project keys (should be valid - will fetch all)"""
@@ -70,8 +66,21 @@ class TestJiraConfig:
             project_keys=None  # None means fetch all projects
         )
         
-        # Should not raise - None is valid (means fetch all)
-        assert config.validate() is True
+        # Construction did not raise - None is valid (means fetch all)
+        assert config.project_keys is None
+
+    
+    def test_from_env_page_size(self, monkeypatch):
+        """Test page size is read from JIRA_PAGE_SIZE with a default of 100"""
+        monkeypatch.setenv("JIRA_URL", "https://test.atlassian.net")
+        monkeypatch.setenv("JIRA_USERNAME", "test@example.com")
+        monkeypatch.setenv("JIRA_API_TOKEN", "test-token-123456")
+        monkeypatch.delenv("JIRA_PAGE_SIZE", raising=False)
+        
+        assert JiraConfig.from_env().page_size == 100
+        
+        monkeypatch.setenv("JIRA_PAGE_SIZE", "250")
+        assert JiraConfig.from_env().page_size == 250
 
 
 class TestReportConfig:
@@ -150,4 +159,4 @@ class TestConfig:
         
         config = Config(jira=jira_config)
         
-        assert config.validate() is True
+        config.validate()
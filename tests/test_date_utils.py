@@ -0,0 +1,54 @@
+"""
+Tests for date utilities
+"""
+
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+
+from src.utils.date_utils import get_month_range, get_week_number, get_week_numbers, parse_jira_datetime
+
+
+@pytest.mark.parametrize("month, last_day", [(1, 31), (2, 28), (12, 31)])
+def test_get_month_range(month, last_day):
+    """Test month ranges span the whole month in UTC, including the December rollover"""
+    start, end = get_month_range(2025, month)
+    assert start == datetime(2025, month, 1, tzinfo=timezone.utc)
+    assert end == datetime(2025, month, last_day, 23, 59, 59, tzinfo=timezone.utc)
+
+
+def test_get_month_range_cached():
+    """Test repeated lookups for the same month reuse the cached range"""
+    assert get_month_range(2025, 6) is get_month_range(2025, 6)
+
+
+@pytest.mark.parametrize("day, expected", [
+    (1, 1), (7, 1), (8, 2), (15, 3), (28, 4), (29, 5), (31, 5),
+])
+def test_get_week_number(day, expected):
+    """Test days fall into 7-day weeks counted from the 1st of the month"""
+    assert get_week_number(datetime(2025, 1, day, 9, 0)) == expected
+
+
+def test_get_week_numbers_matches_scalar():
+    """Test the vectorized week numbers agree with the scalar version"""
+    days = range(1, 32)
+    wall_clock = np.array([f"2025-01-{day:02d}T09:00" for day in days], dtype="datetime64[s]")
+
+    assert get_week_numbers(wall_clock).tolist() == [
+        get_week_number(datetime(2025, 1, day, 9, 0)) for day in days
+    ]
+
+
+@pytest.mark.parametrize("value, offset_hours", [
+    ("2025-01-15T09:00:00.000+0000", 0),
+    ("2025-01-15T09:00:00.000+0800", 8),
+    ("2025-01-15T09:00:00.000-0530", -5.5),
+    ("2025-01-15T09:00:00.000+08:00", 8),
+    ("2025-01-15T09:00:00.000Z", 0),
+])
+def test_parse_jira_datetime(value, offset_hours):
+    """Test Jira timestamps parse with their UTC offset in either offset style"""
+    tz = timezone(timedelta(hours=offset_hours))
+    assert parse_jira_datetime(value) == datetime(2025, 1, 15, 9, 0, tzinfo=tz)
@@ -3,21 +3,21 @@
 Unit tests for generate_report.py
 """
 
-import sys
 import pytest
-from pathlib import Path
 from datetime import datetime, timezone
-from unittest.mock import Mock, patch, MagicMock
-
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from unittest.mock import Mock
 
 from src.config import Config, JiraConfig, ReportConfig
+from src.jira_client import JiraClient
+from src.processors import WorklogProcessor
 from src.models import Author, Component, Issue, Worklog, WorkType
-from src.report_generator import generate_csv_report, generate_monthly_breakdown_report
+from src.report_generator import (
+    generate_csv_report, generate_monthly_breakdown_report, fetch_year_project_data,
+    default_max_workers
+)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_config():
     """Create a mock configuration"""
     jira_config = JiraConfig(
@@ -32,7 +32,7 @@ def mock_config():
     return Config(jira=jira_config, report=report_config)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_author():
     """Create a mock author"""
     return Author(
@@ -42,7 +42,7 @@ def mock_author():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_issues(mock_author):
     """Create mock issues with worklogs"""
     component = Component(name="Backend")
@@ -65,19 +65,26 @@ def mock_issues(mock_author):
     return [issue]
 
 
+@pytest.fixture
+def mock_client(mock_issues):
+    """Create a Jira client mock that connects and returns one issue per raw result"""
+    client = Mock(spec=JiraClient)
+    client.test_connection.return_value = True
+    client.cache_manifest_covers.return_value = False
+    client.get_all_projects.return_value = ["TEST"]
+    client.get_issues_with_worklog.return_value = []
+    client.parse_issues_batch.side_effect = lambda raws, **kwargs: [mock_issues[0] for _ in raws]
+    return client
+
+
 class TestGenerateCSVReport:
     """Test suite for generate_csv_report function"""
     
-    @patch('src.report_generator.JiraClient')
-    def test_generate_report_without_filter(self, mock_jira_client_class, mock_config, mock_issues, tmp_path):
+    def test_generate_report_without_filter(self, mock_client, mock_config, tmp_path):
         """Test generating standard team overview report"""
-        # Setup mock
-        mock_client = Mock()
-        mock_client.test_connection.return_value = True
-        mock_client.get_all_projects.return_value = ["TEST"]
-        mock_client.get_issues_with_worklog.return_value = []
-        mock_client.parse_issue.side_effect = lambda raw, **kwargs: mock_issues[0]
-        mock_jira_client_class.return_value = mock_client
+        mock_client.get_issues_with_worklog.return_value = [{"key": "TEST-123"}]
+        mock_client.is_using_cache.return_value = False
+        mock_client.get_cache_timestamp.return_value = None
         
         # Generate report
         output_file = tmp_path / "test_report.csv"
@@ -85,82 +92,142 @@ class TestGenerateCSVReport:
             config=mock_config,
             year=2025,
             output_file=str(output_file),
-            max_workers=2
+            max_workers=2,
+            client_factory=lambda *args, **kwargs: mock_client
         )
         
         # Verify
         assert mock_client.test_connection.called
-        assert result is not None or result is None  # May be None if no data
+        assert result == output_file
+        lines = output_file.read_text(encoding="utf-8").splitlines()
+        assert "Project,Component,John Doe" in lines
+        assert "TEST,Backend,1.0" in lines
     
-    @patch('src.report_generator.JiraClient')
-    def test_generate_report_with_filter_author(self, mock_jira_client_class, mock_config, mock_author, mock_issues, tmp_path):
-        """Test generating monthly breakdown report for specific user"""
-        # Setup mock
-        mock_client = Mock()
-        mock_client.test_connection.return_value = True
-        mock_client.get_all_projects.return_value = ["TEST"]
-        mock_client.get_issues_with_worklog.return_value = []
-        mock_client.parse_issue.side_effect = lambda raw, **kwargs: mock_issues[0]
-        mock_jira_client_class.return_value = mock_client
-        
-        # Generate report with filter_author
+    def test_generate_monthly_breakdown_report(self, mock_client, mock_config, tmp_path):
+        """Test the monthly breakdown fetches the full year once and writes CSV and XLSX"""
+        mock_client.get_issues_with_worklog.return_value = [{"key": "TEST-123"}]
+        mock_client.is_using_cache.return_value = False
+        mock_client.get_cache_timestamp.return_value = None
         output_file = tmp_path / "test_monthly_breakdown.csv"
-        # Note: filter_author is not supported in the new API directly via generate_monthly_breakdown_report yet
-        # But we can test generate_monthly_breakdown_report
+        
         result = generate_monthly_breakdown_report(
             config=mock_config,
             year=2025,
             output_file=str(output_file),
-            max_workers=2
+            max_workers=2,
+            client_factory=lambda *args, **kwargs: mock_client
         )
         
-        # Verify
-        assert mock_client.test_connection.called
-        assert result is not None or result is None
+        assert result == (output_file, output_file.with_suffix(".xlsx"))
+        assert result[1].exists()
+        mock_client.get_issues_with_worklog.assert_called_once_with(
+            "TEST", "2025-01-01", "2025-12-31", filter_user=None
+        )
+        mock_client.parse_issues_batch.assert_called_once_with([{"key": "TEST-123"}], fetch_all_worklogs=True)
+        lines = output_file.read_text(encoding="utf-8").splitlines()
+        assert "John Doe,Development,TEST,Backend,1.0,,,,,,,,,,,,1.0" in lines
     
-    @patch('src.report_generator.JiraClient')
-    def test_generate_report_with_monthly_breakdown_flag(self, mock_jira_client_class, mock_config, mock_author, tmp_path):
-        """Test that monthly_breakdown parameter is accepted"""
-        # Setup mock
-        mock_client = Mock()
-        mock_client.test_connection.return_value = True
-        mock_client.get_all_projects.return_value = ["TEST"]
-        mock_client.get_issues_with_worklog.return_value = []
-        mock_jira_client_class.return_value = mock_client
+    def test_generate_monthly_breakdown_report_without_data(self, mock_client, mock_config, tmp_path):
+        """Test no report is written when the search finds no issues"""
+        output_file = tmp_path / "test_monthly_breakdown.csv"
+        
+        result = generate_monthly_breakdown_report(
+            config=mock_config,
+            year=2025,
+            output_file=str(output_file),
+            max_workers=2,
+            client_factory=lambda *args, **kwargs: mock_client
+        )
         
-        # This should not raise an error
-        output_file = tmp_path / "test_monthly.csv"
-        try:
-            result = generate_monthly_breakdown_report(
-                config=mock_config,
-                year=2025,
-                output_file=str(output_file),
-                max_workers=2
-            )
-            # If we get here, the function signature is correct
-            assert True
-        except TypeError as e:
-            if "unexpected keyword argument" in str(e):
-                pytest.fail(f"Function signature error: {e}")
-            raise
+        assert result is None
+        assert mock_client.test_connection.called
+        mock_client.get_issues_with_worklog.assert_called_once()
+        assert not output_file.exists()
     
-    @patch('src.report_generator.JiraClient')
-    def test_generate_report_connection_failure(self, mock_jira_client_class, mock_config):
+    def test_generate_report_connection_failure(self, mock_client, mock_config):
         """Test handling of connection failure"""
-        # Setup mock to fail connection
-        mock_client = Mock()
         mock_client.test_connection.return_value = False
-        mock_jira_client_class.return_value = mock_client
         
         # Generate report should return None on connection failure
         result = generate_csv_report(
             config=mock_config,
             year=2025,
-            max_workers=2
+            max_workers=2,
+            client_factory=lambda *args, **kwargs: mock_client
         )
         
         assert result is None
 
+    
+    def test_generate_report_skips_connection_test_on_warm_cache(self, mock_client, mock_config, tmp_path):
+        """Test the connection test is skipped when the cache covers the full year"""
+        mock_client.cache_manifest_covers.return_value = True
+        
+        generate_csv_report(
+            config=mock_config,
+            year=2025,
+            output_file=str(tmp_path / "test_report.csv"),
+            max_workers=2,
+            client_factory=lambda *args, **kwargs: mock_client
+        )
+        
+        mock_client.cache_manifest_covers.assert_called_once_with(2025, ["TEST"])
+        assert not mock_client.test_connection.called
+
+
+class TestFetchYearProjectData:
+    """Test suite for fetch_year_project_data function"""
+    
+    def test_single_fetch_bucketed_by_month(self, mock_author):
+        """Test one full-year search per project, bucketed into monthly aggregates"""
+        march_worklog = Worklog(
+            id="2",
+            author=mock_author,
+            time_spent_seconds=7200,
+            started=datetime(2025, 3, 3, 9, 0, tzinfo=timezone.utc),
+            issue_key="TEST-1"
+        )
+        january_worklog = Worklog(
+            id="1",
+            author=mock_author,
+            time_spent_seconds=3600,
+            started=datetime(2025, 1, 15, 9, 0, tzinfo=timezone.utc),
+            issue_key="TEST-1"
+        )
+        issue = Issue(
+            key="TEST-1",
+            summary="Test issue",
+            issue_type="Task",
+            components=[Component(name="Backend")],
+            labels=[],
+            work_type=WorkType.DEVELOPMENT,
+            worklogs=[january_worklog, march_worklog]
+        )
+        mock_client = Mock(spec=JiraClient)
+        mock_client.get_issues_with_worklog.return_value = [{"key": "TEST-1"}]
+        mock_client.parse_issues_batch.return_value = [issue]
+        
+        project_key, entries_by_month = fetch_year_project_data(
+            mock_client, WorklogProcessor(ReportConfig(year=2025)), "TEST", 2025
+        )
+        
+        mock_client.get_issues_with_worklog.assert_called_once_with(
+            "TEST", "2025-01-01", "2025-12-31", filter_user=None
+        )
+        assert project_key == "TEST"
+        assert sorted(entries_by_month) == list(range(1, 13))
+        assert [e.hours for e in entries_by_month[1]] == [1.0]
+        assert [e.hours for e in entries_by_month[3]] == [2.0]
+        assert not entries_by_month[2]
+
+
 
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+class TestDefaultMaxWorkers:
+    """Test suite for default_max_workers function"""
+    
+    @pytest.mark.parametrize("cpu_count, expected", [(None, 5), (2, 10), (16, 32)])
+    def test_default_max_workers(self, monkeypatch, cpu_count, expected):
+        """Test the default scales with CPU count and is capped at 32"""
+        monkeypatch.setattr('src.report_generator.os.cpu_count', lambda: cpu_count)
+        
+        assert default_max_workers() == expected
@@ -0,0 +1,33 @@
+"""
+Import smoke tests for the package modules
+"""
+
+import importlib
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+MODULES = [
+    "src.config",
+    "src.models",
+    "src.jira_client",
+    "src.processors",
+    "src.exporters",
+    "src.report_generator",
+    "src.utils",
+]
+
+
+@pytest.mark.parametrize("module_name", MODULES)
+def test_import(module_name):
+    """Test the module imports cleanly"""
+    importlib.import_module(module_name)
+
+
+@pytest.mark.parametrize("module_name", ["src.ui.sidebar", "src.ui.state_manager"])
+def test_import_without_streamlit(module_name):
+    """Test UI modules that only use Streamlit inside functions import without it"""
+    code = f"import sys; sys.modules['streamlit'] = None; import {module_name}"
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=Path(__file__).parent.parent)
@@ -0,0 +1,389 @@
+"""
+Tests for Jira client
+"""
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+import pytest
+import responses
+from responses import matchers
+
+from src.jira_client import JiraAuthenticationError, JiraClient, RateLimiter
+from src.models import WorkType
+
+
+# Raw search/jql response shared by parsing tests; parsing never mutates it
+_SAMPLE_ISSUE_RESPONSE = {
+    "total": 1,
+    "issues": [
+        {
+            "key": "TEST-1",
+            "fields": {
+                "summary": "Fix login",
+                "issuetype": {"name": "Bug"},
+                "labels": [],
+                "components": [{"id": "10000", "name": "Backend"}],
+                "worklog": {
+                    "total": 2,
+                    "worklogs": [
+                        {
+                            "id": "100",
+                            "author": {
+                                "accountId": "abc",
+                                "emailAddress": "alice@example.com",
+                                "displayName": "Alice",
+                                "active": True
+                            },
+                            "timeSpentSeconds": 3600,
+                            "started": "2025-01-15T09:00:00.000+0000"
+                        },
+                        {
+                            "id": "101",
+                            "author": {
+                                "accountId": "abc",
+                                "emailAddress": "alice@example.com",
+                                "displayName": "Alice",
+                                "active": True
+                            },
+                            "timeSpentSeconds": 5400,
+                            "started": "2025-01-16T09:00:00.000+0000"
+                        }
+                    ]
+                }
+            }
+        }
+    ]
+}
+
+
+# Built once at import; matches the first page of a January search on TEST
+_JANUARY_FIRST_PAGE = matchers.query_param_matcher({
+    "jql": 'project = TEST AND worklogDate >= "2025-01-01" AND worklogDate <= "2025-01-31"',
+    "startAt": "0",
+}, strict_match=False)
+
+
+@pytest.fixture
+def jira_config(jira_config):
+    """Copy the shared Jira configuration, since client tests tweak it"""
+    return replace(jira_config)
+
+
+@pytest.fixture(scope="class")
+def mocked_responses():
+    """Install one requests mock per test class"""
+    with responses.RequestsMock(assert_all_requests_are_fired=False) as rsps:
+        yield rsps
+
+
+class TestCacheManifest:
+    """Test cache coverage checks"""
+
+    def test_cache_manifest_covers(self, jira_config, tmp_path):
+        """Test coverage requires a cached full-year search for every project"""
+        client = JiraClient(jira_config, enable_cache=True, cache_dir=str(tmp_path))
+        assert not client.cache_manifest_covers(2025, ["TEST", "OTHER"])
+
+        for project_key in ["TEST", "OTHER"]:
+            params = client._build_worklog_search_params(project_key, "2025-01-01", "2025-12-31")
+            params['startAt'] = 0
+            client._save_to_cache(client._get_cache_key("search/jql", params), {"issues": []})
+
+        assert client.cache_manifest_covers(2025, ["TEST", "OTHER"])
+        assert not client.cache_manifest_covers(2024, ["TEST"])
+
+    def test_cache_manifest_requires_every_page(self, jira_config, tmp_path):
+        """Test a partially cached multi-page search does not count as covered"""
+        client = JiraClient(jira_config, enable_cache=True, cache_dir=str(tmp_path))
+        params = client._build_worklog_search_params("TEST", "2025-01-01", "2025-12-31")
+        client._save_to_cache(
+            client._get_cache_key("search/jql", dict(params, startAt=0)),
+            {"total": 3, "issues": [{"key": "TEST-1"}, {"key": "TEST-2"}]}
+        )
+        assert not client.cache_manifest_covers(2025, ["TEST"])
+
+        client._save_to_cache(
+            client._get_cache_key("search/jql", dict(params, startAt=2)),
+            {"total": 3, "issues": [{"key": "TEST-3"}]}
+        )
+        assert client.cache_manifest_covers(2025, ["TEST"])
+
+    def test_cache_manifest_requires_parse_requests(self, jira_config, tmp_path):
+        """Test truncated worklogs and authors without an active flag need their own cached responses"""
+        client = JiraClient(jira_config, enable_cache=True, cache_dir=str(tmp_path))
+        params = client._build_worklog_search_params("TEST", "2025-01-01", "2025-12-31")
+        author = {"accountId": "abc", "displayName": "Jane"}
+        client._save_to_cache(client._get_cache_key("search/jql", dict(params, startAt=0)), {
+            "total": 1,
+            "issues": [{"key": "TEST-1", "fields": {"worklog": {"total": 2, "worklogs": []}}}]
+        })
+        assert not client.cache_manifest_covers(2025, ["TEST"])
+
+        client._save_to_cache(
+            client._get_cache_key("issue/TEST-1/worklog", {"startAt": 0, "maxResults": jira_config.page_size}),
+            {"total": 2, "worklogs": [{"author": author}, {"author": dict(author, active=True)}]}
+        )
+        assert not client.cache_manifest_covers(2025, ["TEST"])
+
+        client._save_to_cache(client._get_cache_key("user?accountId=abc"), {"active": False})
+        assert client.cache_manifest_covers(2025, ["TEST"])
+        assert client.cache_hit_count == 0
+
+    def test_cache_manifest_disabled(self, jira_config, tmp_path):
+        """Test coverage is never reported without cache or known projects"""
+        client = JiraClient(jira_config, enable_cache=False, cache_dir=str(tmp_path))
+        assert not client.cache_manifest_covers(2025, ["TEST"])
+
+        client = JiraClient(jira_config, enable_cache=True, cache_dir=str(tmp_path))
+        assert not client.cache_manifest_covers(2025, None)
+
+    def test_cache_timestamp(self, jira_config, tmp_path):
+        """Test the oldest cached JSON file gives the cache timestamp"""
+        client = JiraClient(jira_config, enable_cache=True, cache_dir=str(tmp_path / "cache"))
+        assert client.get_cache_timestamp() is None
+
+        for name, mtime in [("a.json", 1_700_000_000), ("b.json", 1_600_000_000), ("c.txt", 1)]:
+            path = client.cache_dir / name
+            path.write_text("{}")
+            os.utime(path, (mtime, mtime))
+
+        assert client.get_cache_timestamp().timestamp() == 1_600_000_000
+
+        missing = JiraClient(jira_config, enable_cache=False, cache_dir=str(tmp_path / "missing"))
+        missing.enable_cache = True
+        assert missing.get_cache_timestamp() is None
+
+
+@pytest.mark.xdist_group(name="responses")
+class TestHttpRequests:
+    """Test API calls against mocked Jira endpoints"""
+
+    API = "https://test.atlassian.net/rest/api/3"
+
+    @pytest.fixture(autouse=True)
+    def reset_responses(self, mocked_responses):
+        """Clear registrations and recorded calls between tests"""
+        yield
+        mocked_responses.reset()
+
+    @pytest.fixture
+    def client(self, jira_config, tmp_path):
+        """Create an uncached client"""
+        jira_config.requests_per_sec = 0
+        return JiraClient(jira_config, enable_cache=False, cache_dir=str(tmp_path))
+
+    def test_connection(self, client, mocked_responses):
+        """Test a successful myself call reports a working connection"""
+        mocked_responses.get(f"{self.API}/myself", json={"accountId": "abc"})
+
+        assert client.test_connection()
+        assert len(mocked_responses.calls) == 1
+
+    def test_connection_failure(self, client, mocked_responses):
+        """Test an authentication failure reports a broken connection"""
+        mocked_responses.get(f"{self.API}/myself", status=401)
+
+        assert not client.test_connection()
+        with pytest.raises(JiraAuthenticationError):
+            client._make_request("myself", use_cache=False)
+
+    def test_get_all_projects(self, client, mocked_responses):
+        """Test project keys are read from the project list"""
+        mocked_responses.get(f"{self.API}/project", json=[{"key": "TEST"}, {"key": "OTHER"}])
+
+        assert client.get_all_projects() == ["TEST", "OTHER"]
+
+    def test_get_issues_with_worklog(self, client, mocked_responses):
+        """Test search results are returned from the search endpoint"""
+        mocked_responses.get(
+            f"{self.API}/search/jql", json=_SAMPLE_ISSUE_RESPONSE, match=[_JANUARY_FIRST_PAGE]
+        )
+
+        issues = client.get_issues_with_worklog("TEST", "2025-01-01", "2025-01-31")
+
+        assert [issue["key"] for issue in issues] == ["TEST-1"]
+
+    def test_get_issues_with_worklog_pagination(self, client, mocked_responses):
+        """Test every remaining page is requested after the first and results keep page order"""
+        def search(request):
+            start_at = int(request.params["startAt"])
+            return 200, {}, json.dumps({"total": 3, "issues": [{"key": f"TEST-{start_at + 1}"}]})
+
+        mocked_responses.add_callback(responses.GET, f"{self.API}/search/jql", callback=search)
+
+        issues = client.get_issues_with_worklog("TEST", "2025-01-01", "2025-01-31", page_size=1)
+
+        assert [issue["key"] for issue in issues] == ["TEST-1", "TEST-2", "TEST-3"]
+        offsets = [call.request.params["startAt"] for call in mocked_responses.calls]
+        assert offsets[0] == "0"
+        assert sorted(offsets) == ["0", "1", "2"]
+
+    def test_get_issues_with_worklog_follows_server_page_size(self, client, mocked_responses):
+        """Test later offsets step by the page the server returned, not the maxResults requested"""
+        def search(request):
+            start_at = int(request.params["startAt"])
+            return 200, {}, json.dumps({"total": 5, "issues": [{"key": f"TEST-{i + 1}"} for i in range(start_at, min(start_at + 2, 5))]})
+
+        mocked_responses.add_callback(responses.GET, f"{self.API}/search/jql", callback=search)
+
+        issues = client.get_issues_with_worklog("TEST", "2025-01-01", "2025-01-31", page_size=1000)
+
+        assert [issue["key"] for issue in issues] == [f"TEST-{i}" for i in range(1, 6)]
+        assert sorted(call.request.params["startAt"] for call in mocked_responses.calls) == ["0", "2", "4"]
+
+    def test_in_flight_requests_capped_at_pool_size(self, jira_config, tmp_path, mocked_responses, monkeypatch):
+        """Test concurrent paginated searches never have more requests in flight than pooled connections"""
+        monkeypatch.setattr('src.jira_client.DEFAULT_POOL_SIZE', 2)
+        jira_config.requests_per_sec = 0
+        jira_config.max_workers = 1
+        client = JiraClient(jira_config, enable_cache=False, cache_dir=str(tmp_path))
+        lock = threading.Lock()
+        in_flight = [0]
+        peak = [0]
+
+        def search(request):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            start_at = int(request.params["startAt"])
+            return 200, {}, json.dumps({"total": 6, "issues": [{"key": f"TEST-{start_at + 1}"}]})
+
+        mocked_responses.add_callback(responses.GET, f"{self.API}/search/jql", callback=search)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(
+                lambda _: client.get_issues_with_worklog("TEST", "2025-01-01", "2025-01-31", page_size=1),
+                range(4)
+            ))
+
+        assert all(len(issues) == 6 for issues in results)
+        assert peak[0] <= 2
+
+    def test_get_issues_with_worklog_single_page(self, client, mocked_responses):
+        """Test the configured page size is requested, so a month of issues needs one call"""
+        batch = {"total": 100, "issues": [{"key": f"TEST-{i}"} for i in range(100)]}
+        mocked_responses.get(f"{self.API}/search/jql", json=batch)
+
+        issues = client.get_issues_with_worklog("TEST", "2025-01-01", "2025-01-31")
+
+        assert len(issues) == 100
+        assert len(mocked_responses.calls) == 1
+        assert mocked_responses.calls[0].request.params["maxResults"] == str(client.config.page_size)
+
+
+class TestParseIssues:
+    """Test parsing raw search results into models"""
+
+    def test_parse_issues_batch(self, jira_config, tmp_path):
+        """Test components, work type and worklogs are parsed from the raw payload"""
+        client = JiraClient(jira_config, enable_cache=False, cache_dir=str(tmp_path))
+
+        issues = client.parse_issues_batch(_SAMPLE_ISSUE_RESPONSE["issues"])
+
+        assert len(issues) == 1
+        issue = issues[0]
+        assert issue.key == "TEST-1"
+        assert [c.name for c in issue.components] == ["Backend"]
+        assert issue.work_type == WorkType.MAINTENANCE
+        assert [wl.hours for wl in issue.worklogs] == [1.0, 1.5]
+        assert issue.worklogs[0].author is issue.worklogs[1].author
+        assert issue.worklogs[0].started.utcoffset().total_seconds() == 0
+
+    def test_parse_issue_matches_batch(self, jira_config, tmp_path):
+        """Test single-issue parsing agrees with batch parsing"""
+        client = JiraClient(jira_config, enable_cache=False, cache_dir=str(tmp_path))
+        raw = _SAMPLE_ISSUE_RESPONSE["issues"][0]
+
+        single = client.parse_issue(raw)
+        batch = client.parse_issues_batch([raw])[0]
+
+        assert single.get_total_hours() == batch.get_total_hours() == 2.5
+        assert [wl.id for wl in single.worklogs] == [wl.id for wl in batch.worklogs]
+
+    def test_author_pool_scoped_to_client(self, jira_config, tmp_path, monkeypatch):
+        """Test authors are shared per payload within a client, looked up once, and not across clients"""
+        client = JiraClient(jira_config, enable_cache=False, cache_dir=str(tmp_path))
+        lookups = []
+        monkeypatch.setattr(client, "get_user_details", lambda account_id: lookups.append(account_id) or {"active": False})
+        payload = {"accountId": "abc", "emailAddress": "alice@example.com", "displayName": "Alice"}
+
+        author = client._parse_author(payload)
+
+        assert client._parse_author(dict(payload)) is author
+        assert lookups == ["abc"]
+        assert author.active is False
+        renamed = client._parse_author(dict(payload, displayName="Alice Smith"))
+        assert renamed is not author and renamed.display_name == "Alice Smith"
+        other_client = JiraClient(jira_config, enable_cache=False, cache_dir=str(tmp_path))
+        assert other_client._parse_author(dict(payload, active=True)) is not author
+
+
+class TestCategorizeWorkType:
+    """Test work type categorization from issue fields"""
+
+    @pytest.mark.parametrize("fields, expected", [
+        ({"customfield_10082": {"value": "Development"}, "issuetype": {"name": "Bug"}}, WorkType.DEVELOPMENT),
+        ({"customfield_10048": "Maintenance", "issuetype": {"name": "Task"}}, WorkType.MAINTENANCE),
+        ({"issuetype": {"name": "Bug"}, "labels": []}, WorkType.MAINTENANCE),
+        ({"issuetype": {"name": "Story"}, "labels": ["Hotfix"]}, WorkType.MAINTENANCE),
+        ({"issuetype": {"name": "Story"}, "labels": ["frontend"]}, WorkType.DEVELOPMENT),
+        ({}, WorkType.DEVELOPMENT),
+    ])
+    def test_categorize_work_type(self, fields, expected):
+        """Test custom category fields win over issue type and labels"""
+        assert JiraClient._categorize_work_type(fields) == expected
+
+
+class TestRateLimiter:
+    """Test shared token bucket"""
+
+    def test_burst_then_throttle(self, monkeypatch):
+        """Test tokens are spent immediately up to the burst, then refilled at the rate"""
+        clock = [0.0]
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        monkeypatch.setattr('src.jira_client.time.monotonic', lambda: clock[0])
+        monkeypatch.setattr('src.jira_client.time.sleep', fake_sleep)
+        limiter = RateLimiter(requests_per_sec=2)
+
+        limiter.acquire()
+        limiter.acquire()
+        assert sleeps == []
+
+        limiter.acquire()
+        assert sleeps == [pytest.approx(0.5)]
+
+    def test_client_creates_limiter_from_config(self, jira_config, tmp_path):
+        """Test the client limits requests unless the configured rate is 0"""
+        client = JiraClient(jira_config, enable_cache=False, cache_dir=str(tmp_path))
+        assert client.rate_limiter.rate == jira_config.requests_per_sec
+
+        jira_config.requests_per_sec = 0
+        client = JiraClient(jira_config, enable_cache=False, cache_dir=str(tmp_path))
+        assert client.rate_limiter is None
+
+
+class TestSession:
+    """Test the shared HTTP session"""
+
+    def test_session_pools_and_retries(self, jira_config, tmp_path):
+        """Test the adapter is sized for the worker pool and retries transient errors"""
+        jira_config.max_workers = 64
+        client = JiraClient(jira_config, enable_cache=False, cache_dir=str(tmp_path))
+
+        adapter = client.session.get_adapter(jira_config.url)
+        assert adapter._pool_maxsize == 64
+        assert adapter.max_retries.total == 3
+        assert 429 in adapter.max_retries.status_forcelist
@@ -0,0 +1,46 @@
+"""
+Tests for logging configuration
+"""
+
+import logging
+import logging.handlers
+
+import pytest
+
+from src.utils.logging_config import setup_logging
+
+
+@pytest.fixture
+def restore_root_logger():
+    """Put the root logger's handlers and level back after the test"""
+    root_logger = logging.getLogger()
+    handlers, level = root_logger.handlers[:], root_logger.level
+    yield root_logger
+    root_logger.handlers = handlers
+    root_logger.setLevel(level)
+
+
+def test_setup_logging_keeps_record_fields(restore_root_logger):
+    """Test thread and process details are still collected for other formatters"""
+    setup_logging()
+
+    assert logging.logThreads
+    assert logging.logProcesses
+    record = logging.LogRecord("test", logging.INFO, __file__, 1, "message", None, None)
+    assert record.thread is not None
+    assert record.process is not None
+
+
+def test_setup_logging_closes_replaced_file_handler(restore_root_logger, tmp_path):
+    """Test a repeated call flushes and closes the previous buffered log file"""
+    log_file = tmp_path / "app.log"
+    setup_logging(log_file=log_file)
+    buffered = next(h for h in restore_root_logger.handlers if isinstance(h, logging.handlers.MemoryHandler))
+    file_handler = buffered.target
+    logging.getLogger("test").info("first run")
+
+    setup_logging()
+
+    assert buffered not in restore_root_logger.handlers
+    assert file_handler.stream is None
+    assert "first run" in log_file.read_text()
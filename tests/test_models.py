@@ -3,11 +3,13 @@ Tests for data models
 """
 
 import pytest
-from datetime import datetime
+import numpy as np
+from datetime import datetime, timezone, timedelta
 
 from src.models import (
     Author, Component, Worklog, Issue, WorkType,
-    ProjectComponent, TimeEntry, MonthlyReport, YearlyReport
+    ProjectComponent, TimeEntry, MonthlyReport, YearlyReport,
+    WorklogTable, WORK_TYPE_CODES
 )
 
 
@@ -45,6 +47,35 @@ class TestAuthor:
         author5 = Author(email="test@example.com", display_name="Test", account_id="123")
         author6 = Author(email="different@example.com", display_name="Different", account_id="123")
         assert author5 == author6
+    
+    def test_author_frozen(self):
+        """Test authors are immutable and usable as set members"""
+        author = Author(email="test@example.com", display_name="Test")
+        
+        with pytest.raises(AttributeError):
+            author.email = "other@example.com"
+        assert Author(email="test@example.com", display_name="Test") in {author}
+
+
+class TestComponent:
+    """Test Component model"""
+    
+    def test_component_intern(self):
+        """Test interning returns one shared instance per name and id within a pool"""
+        pool = {}
+        component = Component.intern(pool, name="Interned", id="10")
+        
+        assert Component.intern(pool, name="Interned", id="10") is component
+        assert Component.intern(pool, name="Interned") is not component
+        assert Component.intern(pool, name="Interned") == Component(name="Interned")
+        assert Component.intern({}, name="Interned", id="10") is not component
+    
+    def test_component_frozen(self):
+        """Test components are immutable"""
+        component = Component(name="Backend")
+        
+        with pytest.raises(AttributeError):
+            component.name = "Frontend"
 
 
 class TestWorklog:
@@ -81,30 +112,19 @@ class TestWorklog:
     
 
     
-    def test_worklog_week_number(self):
+    @pytest.mark.parametrize("day, expected_week", [
+        (5, 1),   # Day 1-7 = Week 1
+        (10, 2),  # Day 8-14 = Week 2
+        (30, 5),  # Day 29+ = Week 5
+    ])
+    def test_worklog_week_number(self, day, expected_week):
         """Test week number calculation"""
         author = Author(email="test@example.com", display_name="Test")
-        
-        # Day 1-7 = Week 1
-        worklog1 = Worklog(
+        worklog = Worklog(
             id="1", author=author, time_spent_seconds=3600,
-            started=datetime(2025, 1, 5, 9, 0), issue_key="TEST-123"
+            started=datetime(2025, 1, day, 9, 0), issue_key="TEST-123"
         )
-        assert worklog1.week_number == 1
-        
-        # Day 8-14 = Week 2
-        worklog2 = Worklog(
-            id="2", author=author, time_spent_seconds=3600,
-            started=datetime(2025, 1, 10, 9, 0), issue_key="TEST-123"
-        )
-        assert worklog2.week_number == 2
-        
-        # Day 29+ = Week 5 (capped)
-        worklog3 = Worklog(
-            id="3", author=author, time_spent_seconds=3600,
-            started=datetime(2025, 1, 30, 9, 0), issue_key="TEST-123"
-        )
-        assert worklog3.week_number == 5
+        assert worklog.week_number == expected_week
 
 
 class TestIssue:
@@ -153,6 +173,91 @@ class TestIssue:
         assert issue.get_total_hours() == 3.0
 
 
+class TestWorklogTable:
+    """Test columnar WorklogTable"""
+    
+    def test_from_worklogs(self):
+        """Test building columns from worklogs"""
+        alice = Author(email="alice@example.com", display_name="Alice")
+        bob = Author(email="bob@example.com", display_name="Bob")
+        worklogs = [
+            Worklog(id="1", author=alice, time_spent_seconds=3600,
+                    started=datetime(2025, 1, 15, 9, 0), issue_key="TEST-1"),
+            Worklog(id="2", author=bob, time_spent_seconds=7200,
+                    started=datetime(2025, 1, 30, 9, 0), issue_key="TEST-1"),
+            Worklog(id="3", author=alice, time_spent_seconds=1800,
+                    started=datetime(2025, 1, 2, 9, 0), issue_key="TEST-1"),
+        ]
+        
+        table = WorklogTable.from_worklogs(worklogs, WorkType.MAINTENANCE)
+        
+        assert len(table) == 3
+        assert table.authors == [alice, bob]
+        assert table.author_id.tolist() == [0, 1, 0]
+        assert table.hours.tolist() == [1.0, 2.0, 0.5]
+        assert table.week_number.tolist() == [3, 5, 1]
+        assert set(table.work_type.tolist()) == {WORK_TYPE_CODES[WorkType.MAINTENANCE]}
+    
+    def test_started_normalized_to_utc(self):
+        """Test timezone-aware start times are stored as UTC"""
+        author = Author(email="test@example.com", display_name="Test")
+        started = datetime(2025, 1, 1, 8, 0, tzinfo=timezone(timedelta(hours=8)))
+        worklog = Worklog(id="1", author=author, time_spent_seconds=3600,
+                          started=started, issue_key="TEST-1")
+        
+        table = WorklogTable.from_worklogs([worklog])
+        
+        assert table.started[0] == np.datetime64("2025-01-01T00:00:00", "us")
+    
+    def test_week_number_uses_local_day(self):
+        """Test week numbers follow the worklog's own calendar day, not the UTC day"""
+        author = Author(email="test@example.com", display_name="Test")
+        started = datetime(2025, 1, 8, 2, 0, tzinfo=timezone(timedelta(hours=8)))
+        worklog = Worklog(id="1", author=author, time_spent_seconds=3600,
+                          started=started, issue_key="TEST-1")
+        
+        table = WorklogTable.from_worklogs([worklog])
+        
+        assert table.week_number.tolist() == [worklog.week_number] == [2]
+    
+    def test_concatenate(self):
+        """Test concatenation remaps authors and records issue positions"""
+        alice = Author(email="alice@example.com", display_name="Alice", account_id="a")
+        bob = Author(email="bob@example.com", display_name="Bob", account_id="b")
+        first = WorklogTable.from_worklogs([
+            Worklog(id="1", author=alice, time_spent_seconds=3600,
+                    started=datetime(2025, 1, 1), issue_key="TEST-1"),
+        ])
+        second = WorklogTable.from_worklogs([
+            Worklog(id="2", author=bob, time_spent_seconds=3600,
+                    started=datetime(2025, 1, 2), issue_key="TEST-2"),
+            Worklog(id="3", author=alice, time_spent_seconds=3600,
+                    started=datetime(2025, 1, 3), issue_key="TEST-2"),
+        ])
+        
+        table = WorklogTable.concatenate([first, second])
+        
+        assert table.authors == [alice, bob]
+        assert table.author_id.tolist() == [0, 1, 0]
+        assert table.issue_idx.tolist() == [0, 1, 1]
+    
+    def test_issue_builds_table_lazily(self):
+        """Test Issue builds its worklog table on first use"""
+        author = Author(email="test@example.com", display_name="Test")
+        issue = Issue(
+            key="TEST-1", summary="Test", issue_type="Task",
+            components=[Component(name="Backend")], labels=[],
+            work_type=WorkType.DEVELOPMENT,
+            worklogs=[Worklog(id="1", author=author, time_spent_seconds=3600,
+                              started=datetime(2025, 1, 1), issue_key="TEST-1")]
+        )
+        
+        table = issue.get_worklog_table()
+        
+        assert len(table) == 1
+        assert issue.get_worklog_table() is table
+
+
 class TestProjectComponent:
     """Test ProjectComponent model"""
     
@@ -178,6 +283,39 @@ class TestProjectComponent:
         pc = ProjectComponent(project="TEST", component=Component(name="Backend"))
         
         assert str(pc) == "TEST - Backend"
+    
+    def test_project_component_intern(self):
+        """Test interning returns one shared instance per project and component within a pool"""
+        pool = {}
+        pc = ProjectComponent.intern(pool, "INTERN", Component(name="Backend"))
+        
+        assert ProjectComponent.intern(pool, "INTERN", Component(name="Backend")) is pc
+        assert ProjectComponent.intern(pool, "INTERN", Component(name="Frontend")) is not pc
+        assert ProjectComponent.intern(pool, "INTERN", Component(name="Backend", id="7")) is not pc
+        assert ProjectComponent.intern({}, "INTERN", Component(name="Backend")) is not pc
+        assert pc == ProjectComponent(project="INTERN", component=Component(name="Backend"))
+
+
+class TestTimeEntry:
+    """Test TimeEntry model"""
+    
+    def test_add_hours_deduplicates_issues(self):
+        """Test add_hours keeps issue keys unique and in first-seen order"""
+        entry = TimeEntry(
+            project_component=ProjectComponent(project="TEST", component=Component(name="Backend")),
+            author=Author(email="test@example.com", display_name="Test"),
+            hours=1.0,
+            work_type=WorkType.DEVELOPMENT,
+            issues=["TEST-1"]
+        )
+        
+        entry.add_hours(2.0, "TEST-2", week=1)
+        entry.add_hours(1.5, "TEST-1", week=1)
+        entry.add_hours(0.5, None, week=2)
+        
+        assert entry.hours == 5.0
+        assert entry.issues == ["TEST-1", "TEST-2"]
+        assert entry.week_hours == {1: 3.5, 2: 0.5}
 
 
 class TestMonthlyReport:
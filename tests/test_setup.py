@@ -3,57 +3,11 @@
 Verify the Automate Jira setup
 """
 
+import os
+import subprocess
 import sys
 from pathlib import Path
 
-def check_imports():
-    """Check if all imports work"""
-    print("Checking imports...")
-    
-    try:
-        from src.config import Config, JiraConfig, ReportConfig
-        print("  ✅ Config imports OK")
-    except ImportError as e:
-        print(f"  ❌ Config import failed: {e}")
-        return False
-    
-    try:
-        from src.models import Issue, Worklog, Author, Component
-        print("  ✅ Models imports OK")
-    except ImportError as e:
-        print(f"  ❌ Models import failed: {e}")
-        return False
-    
-    try:
-        from src.jira_client import JiraClient
-        print("  ✅ JiraClient import OK")
-    except ImportError as e:
-        print(f"  ❌ JiraClient import failed: {e}")
-        return False
-    
-    try:
-        from src.processors import WorklogProcessor
-        print("  ✅ Processors import OK")
-    except ImportError as e:
-        print(f"  ❌ Processors import failed: {e}")
-        return False
-    
-    try:
-        from src.exporters import CSVExporter
-        print("  ✅ Exporters import OK")
-    except ImportError as e:
-        print(f"  ❌ Exporters import failed: {e}")
-        return False
-    
-    try:
-        from src.utils import get_month_range, format_date_for_jql, setup_logging
-        print("  ✅ Utils imports OK")
-    except ImportError as e:
-        print(f"  ❌ Utils import failed: {e}")
-        return False
-    
-    return True
-
 def check_structure():
     """Check if directory structure is correct"""
     print("\nChecking directory structure...")
@@ -67,13 +21,6 @@ def check_structure():
         "tests"
     ]
     
-    for dir_path in required_dirs:
-        if Path(dir_path).exists():
-            print(f"  ✅ {dir_path}/ exists")
-        else:
-            print(f"  ❌ {dir_path}/ missing")
-            return False
-    
     required_files = [
         "src/__init__.py",
         "src/config.py",
@@ -86,36 +33,52 @@ def check_structure():
         "README.md"
     ]
     
-    for file_path in required_files:
-        if Path(file_path).exists():
-            print(f"  ✅ {file_path} exists")
+    # One directory listing per parent instead of a stat per required path
+    listings = {}
+    for parent in {os.path.dirname(path) or "." for path in required_dirs + required_files}:
+        try:
+            with os.scandir(parent) as entries:
+                listings[parent] = {entry.name: entry.is_dir() for entry in entries}
+        except FileNotFoundError:
+            listings[parent] = {}
+    
+    def present(path, is_dir):
+        listing = listings[os.path.dirname(path) or "."]
+        name = os.path.basename(path)
+        return name in listing and listing[name] == is_dir
+    
+    all_present = True
+    for path, is_dir in [(d, True) for d in required_dirs] + [(f, False) for f in required_files]:
+        label = f"{path}/" if is_dir else path
+        if present(path, is_dir):
+            print(f"  [OK] {label} exists")
         else:
-            print(f"  ❌ {file_path} missing")
-            return False
+            print(f"  [FAIL] {label} missing")
+            all_present = False
     
-    return True
+    return all_present
 
 def check_config():
     """Check if .env file exists"""
     print("\nChecking configuration...")
     
     if Path(".env").exists():
-        print("  ✅ .env file exists")
+        print("  [OK] .env file exists")
         
         # Try to load config
         try:
             from src.config import Config
             config = Config.from_env()
-            print("  ✅ Configuration loads successfully")
+            print("  [OK] Configuration loads successfully")
             print(f"     - Jira URL: {config.jira.url}")
             print(f"     - Projects: {', '.join(config.jira.project_keys)}")
             return True
         except ValueError as e:
-            print(f"  ⚠️  Configuration error: {e}")
+            print(f"  [WARN] Configuration error: {e}")
             print("     Please check your .env file")
             return False
     else:
-        print("  ⚠️  .env file not found")
+        print("  [WARN] .env file not found")
         print("     Create .env file with your Jira credentials")
         print("     See config.env.example for template")
         return False
@@ -126,8 +89,16 @@ def main():
     print("  Automate Jira - Setup Verification")
     print("="*60)
     
+    # The import check runs pytest in a child process, so it overlaps the
+    # in-process checks and its output can still be shown first
+    imports = subprocess.Popen(
+        [sys.executable, "-m", "pytest", "-q", str(Path(__file__).parent / "test_imports.py")],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True
+    )
+    
     checks = [
-        ("Imports", check_imports),
         ("Structure", check_structure),
         ("Configuration", check_config)
     ]
@@ -137,13 +108,18 @@ def main():
         result = check_func()
         results.append((name, result))
     
+    output, _ = imports.communicate()
+    print("\nChecking imports...")
+    print(output, end="")
+    results.insert(0, ("Imports", imports.returncode == 0))
+    
     print("\n" + "="*60)
     print("  Summary")
     print("="*60)
     
     all_passed = True
     for name, result in results:
-        status = "✅ PASS" if result else "❌ FAIL"
+        status = "PASS" if result else "FAIL"
         print(f"  {name}: {status}")
         if not result:
             all_passed = False
@@ -151,13 +127,13 @@ def main():
     print("="*60)
     
     if all_passed:
-        print("\n✨ All checks passed! You're ready to generate reports.")
+        print("\nAll checks passed! You're ready to generate reports.")
         print("\nNext steps:")
         print("  1. Run: python scripts/generate_report.py")
         print("  2. Or: python scripts/cli.py --help")
         return 0
     else:
-        print("\n⚠️  Some checks failed. Please fix the issues above.")
+        print("\n[WARN] Some checks failed. Please fix the issues above.")
         return 1
 
 if __name__ == "__main__":
@@ -3,14 +3,12 @@
 Unit tests for YearlyOverviewExporter
 """
 
-import sys
+import csv
+import io
+import numpy as np
 import pytest
-from pathlib import Path
 from datetime import datetime, timezone
 
-# Add parent directory to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from src.exporters import YearlyOverviewExporter
 from src.models import (
     YearlyReport, MonthlyReport, TimeEntry,
@@ -18,41 +16,46 @@ from src.models import (
 )
 
 
-@pytest.fixture
+# Development hours in sample_yearly_report, keyed by name rather than column position
+DEV_COMPONENTS = [("TEST", "Backend"), ("TEST", "Frontend")]
+DEV_AUTHORS = ["Jane Smith", "John Doe"]
+DEV_HOURS = np.array([[15.0, 10.0], [12.0, 8.0]])  # rows follow DEV_COMPONENTS, columns DEV_AUTHORS
+
+
+def read_development_section(path):
+    """Parse the DEVELOPMENT section into ({(project, component): {author: hours}}, {author: total})"""
+    with open(path, newline='') as f:
+        assert f.readline().strip() == "DEVELOPMENT"
+        hours = {}
+        for row in csv.DictReader(f):
+            key = (row.pop("Project"), row.pop("Component"))
+            values = {author: float(value) if value else 0.0 for author, value in row.items()}
+            if key[0] == "TOTAL":
+                return hours, values
+            hours[key] = values
+    raise AssertionError("DEVELOPMENT section has no TOTAL row")
+
+
+@pytest.fixture(scope="module")
 def sample_yearly_report():
-    """Create a sample yearly report with multiple users"""
-    author1 = Author(email="john@example.com", display_name="John Doe")
-    author2 = Author(email="jane@example.com", display_name="Jane Smith")
-    
-    pc1 = ProjectComponent(project="TEST", component=Component(name="Backend"))
-    pc2 = ProjectComponent(project="TEST", component=Component(name="Frontend"))
-    
-    entries = [
-        TimeEntry(
-            project_component=pc1,
-            author=author1,
-            hours=10.0,
-            work_type=WorkType.DEVELOPMENT
-        ),
-        TimeEntry(
-            project_component=pc1,
-            author=author2,
-            hours=15.0,
-            work_type=WorkType.DEVELOPMENT
-        ),
-        TimeEntry(
-            project_component=pc2,
-            author=author1,
-            hours=8.0,
-            work_type=WorkType.DEVELOPMENT
-        ),
+    """Create a sample yearly report with multiple users (read-only, shared by the module)"""
+    authors = {
+        "John Doe": Author(email="john@example.com", display_name="John Doe"),
+        "Jane Smith": Author(email="jane@example.com", display_name="Jane Smith"),
+    }
+    components = [ProjectComponent(project=project, component=Component(name=name)) for project, name in DEV_COMPONENTS]
+    
+    # One Development entry per cell of DEV_HOURS, materialized in a single list()
+    entries = list(
         TimeEntry(
-            project_component=pc2,
-            author=author2,
-            hours=12.0,
+            project_component=components[row],
+            author=authors[name],
+            hours=float(DEV_HOURS[row, col]),
             work_type=WorkType.DEVELOPMENT
-        ),
-    ]
+        )
+        for row in range(len(DEV_COMPONENTS))
+        for col, name in enumerate(DEV_AUTHORS)
+    )
     
     monthly = MonthlyReport(
         year=2025,
@@ -77,24 +80,16 @@ def test_export_yearly_with_total_row(sample_yearly_report, tmp_path):
     
     assert result.exists()
     
-    # Read and verify content
-    with open(result, 'r') as f:
-        lines = f.readlines()
-    
-    # Check header
-    # Line 0 is "DEVELOPMENT"
-    assert "DEVELOPMENT" in lines[0]
-    # Line 1 is header
-    assert "Project,Component,Jane Smith,John Doe" in lines[1]
+    hours, totals = read_development_section(result)
     
     # Check data rows (Development section)
-    assert "TEST,Backend,15.0,10.0" in lines[2]
-    assert "TEST,Frontend,12.0,8.0" in lines[3]
+    assert hours == {
+        ("TEST", "Backend"): {"Jane Smith": 15.0, "John Doe": 10.0},
+        ("TEST", "Frontend"): {"Jane Smith": 12.0, "John Doe": 8.0},
+    }
     
     # Check Development TOTAL row
-    assert "TOTAL,,27.0,18.0" in lines[4]
-    
-    print("✅ TOTAL row correctly added to CSV")
+    assert totals == {"Jane Smith": 27.0, "John Doe": 18.0}
 
 
 def test_export_yearly_total_calculation(sample_yearly_report, tmp_path):
@@ -104,24 +99,12 @@ def test_export_yearly_total_calculation(sample_yearly_report, tmp_path):
     
     result = exporter.export_yearly(sample_yearly_report)
     
-    # Read CSV
-    with open(result, 'r') as f:
-        lines = f.readlines()
-    
-    # Parse TOTAL row (Development total is at index 4)
-    total_line = lines[4].strip()
-    parts = total_line.split(',')
-    
-    assert parts[0] == "TOTAL"
-    assert parts[1] == ""
+    hours, totals = read_development_section(result)
     
-    # Jane Smith total: 15.0 + 12.0 = 27.0
-    assert float(parts[2]) == 27.0
-    
-    # John Doe total: 10.0 + 8.0 = 18.0
-    assert float(parts[3]) == 18.0
-    
-    print("✅ TOTAL row calculations are correct")
+    # Data rows match the grid, and the TOTAL row sums its columns per author
+    grid = [[hours[component][author] for author in DEV_AUTHORS] for component in DEV_COMPONENTS]
+    np.testing.assert_allclose(grid, DEV_HOURS)
+    np.testing.assert_allclose([totals[author] for author in DEV_AUTHORS], DEV_HOURS.sum(axis=0))
 
 
 def test_export_monthly_with_total_row(tmp_path):
@@ -160,16 +143,13 @@ def test_export_monthly_with_total_row(tmp_path):
     
     assert result.exists()
     
-    # Read and verify
-    with open(result, 'r') as f:
-        lines = f.readlines()
-    
-    # Check for TOTAL row
-    assert len(lines) >= 4  # header + data + empty + total
-    assert "TOTAL" in lines[-1]
+    # Whole file against a golden CSV: header + data + empty + TOTAL row
+    expected = io.StringIO()
+    writer = csv.writer(expected, lineterminator="\n")
+    writer.writerow(["Project", "Component", "Jane Smith", "John Doe"])
+    writer.writerow(["TEST", "Backend", "15.0", "10.0"])
+    writer.writerow([])
+    writer.writerow(["TOTAL", "", "15.0", "10.0"])
     
-    print("✅ TOTAL row added to monthly export")
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+    with open(result, newline='') as f:
+        assert f.read().replace("\r\n", "\n") == expected.getvalue()
@@ -0,0 +1,79 @@
+"""
+Tests for Streamlit UI components
+"""
+
+import pandas as pd
+import pytest
+
+pytest.importorskip("streamlit")
+pytest.importorskip("jinja2")  # pandas Styler rendering
+
+from src.ui import components
+from src.ui.components import _build_section_df, _numeric_columns
+
+
+# One data row and one TOTAL row in the weekly layout: Project, Component, 60 weeks, Total
+WEEKLY_ROWS = [
+    ("SOMEPROJ", "Backend") + (1.234,) * 60 + (90.0,),
+    ("TOTAL", "") + (1.234,) * 60 + (90.0,),
+]
+
+
+def test_weekly_numeric_columns_exclude_labels():
+    """Test Project and Component are matched on the second level of weekly columns"""
+    df, _ = _build_section_df(WEEKLY_ROWS, None, is_multilevel=True)
+
+    numeric_cols = _numeric_columns(df.columns, is_multilevel=True)
+
+    assert ('', 'Project') not in numeric_cols
+    assert ('', 'Component') not in numeric_cols
+    assert len(numeric_cols) == 61
+    assert (df[numeric_cols].dtypes == 'float64').all()
+
+
+def test_placeholder_hour_cells_become_nan():
+    """Test non-numeric hour cells are coerced so the column keeps float64 formatting"""
+    rows = [("SOMEPROJ", "Backend", 1.5, "-", None), ("TOTAL", "", 1.5, 0.0, 1.5)]
+    df, _ = _build_section_df(rows, ("Project", "Component", "Alice", "Bob", "Total"))
+
+    numeric_cols = _numeric_columns(df.columns, is_multilevel=False)
+
+    assert (df[numeric_cols].dtypes == 'float64').all()
+    assert df[numeric_cols].isna().sum().sum() == 2
+
+
+def test_weekly_frame_renders_through_styler(monkeypatch):
+    """Test the weekly preview is shown styled, with formatted hours and a highlighted TOTAL row"""
+    shown = []
+    monkeypatch.setattr(components.st, "dataframe", lambda data, **kwargs: shown.append(data))
+    df, project_col = _build_section_df(WEEKLY_ROWS, None, is_multilevel=True)
+
+    components._display_dataframe_with_styling(df, project_col, is_multilevel=True)
+
+    assert len(shown) == 1
+    styler = shown[0]
+    assert isinstance(styler, pd.io.formats.style.Styler)
+    html = styler.to_html()
+    assert "SOMEPROJ" in html
+    assert ">1.2<" in html and "1.234" not in html
+    assert components._TOTAL_ROW_STYLE.split(";")[0] in html
+
+
+def test_parse_xlsx_sheet_skips_only_empty_first_cells():
+    """Test rows are skipped only when column A is empty, not when it holds 0"""
+    openpyxl = pytest.importorskip("openpyxl")
+    ws = openpyxl.Workbook().active
+    for row in [
+        ("DEVELOPMENT",),
+        ("Project", "Component", "Alice"),
+        (0, "Backend", 2.0),
+        (None, "Stray", 1.0),
+        ("TOTAL", "", 2.0),
+    ]:
+        ws.append(row)
+
+    dev_data, maint_data, header_row, _, _ = components._parse_xlsx_sheet(ws)
+
+    assert header_row == ("Project", "Component", "Alice")
+    assert dev_data == [(0, "Backend", 2.0), ("TOTAL", "", 2.0)]
+    assert maint_data == []
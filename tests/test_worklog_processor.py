@@ -0,0 +1,190 @@
+"""
+Tests for worklog processor
+"""
+
+import pytest
+from datetime import datetime, timezone
+
+from src.config import ReportConfig
+from src.models import (
+    Author, Component, Worklog, Issue, WorkType,
+    ProjectComponent, TimeEntry
+)
+from src.processors.worklog_processor import WorklogProcessor
+from src.utils.date_utils import get_month_range
+
+
+@pytest.fixture
+def processor():
+    """Create a worklog processor"""
+    return WorklogProcessor(ReportConfig(year=2025))
+
+
+def make_entry(author, hours, issue_key, week=1, component="Backend"):
+    """Create a single-issue time entry"""
+    entry = TimeEntry(
+        project_component=ProjectComponent(project="TEST", component=Component(name=component)),
+        author=author,
+        hours=hours,
+        work_type=WorkType.DEVELOPMENT,
+        issues=[issue_key]
+    )
+    entry.week_hours[week] = hours
+    return entry
+
+
+class TestAggregateEntries:
+    """Test aggregating time entries"""
+
+    def test_aggregate_entries_leaves_inputs_untouched(self, processor):
+        """Test aggregating twice over the same entries gives the same totals"""
+        author = Author(email="alice@example.com", display_name="Alice")
+        january = [make_entry(author, 1.0, "TEST-1", week=1)]
+        february = [make_entry(author, 2.0, "TEST-2", week=2)]
+
+        first = processor.aggregate_entries(january + february)
+        second = processor.aggregate_entries(january + february)
+
+        assert [e.hours for e in first.values()] == [e.hours for e in second.values()] == [3.0]
+        assert january[0].hours == 1.0
+        assert january[0].issues == ["TEST-1"]
+        assert january[0].week_hours == {1: 1.0}
+
+
+class TestProcessIssues:
+    """Test processing issues into time entries"""
+
+    def test_groups_hours_by_component_author_and_week(self, processor):
+        """Test worklogs are summed per key with week breakdown and unique issues"""
+        alice = Author(email="alice@example.com", display_name="Alice")
+        bob = Author(email="bob@example.com", display_name="Bob")
+        backend = Component(name="Backend")
+        frontend = Component(name="Frontend")
+
+        def worklog(author, hours, day, issue_key):
+            return Worklog(
+                id=f"{issue_key}-{day}", author=author, time_spent_seconds=int(hours * 3600),
+                started=datetime(2025, 1, day, 9, 0), issue_key=issue_key
+            )
+
+        issues = [
+            Issue(
+                key="TEST-1", summary="", issue_type="Task", components=[backend, frontend],
+                labels=[], work_type=WorkType.DEVELOPMENT,
+                worklogs=[worklog(alice, 4, 2, "TEST-1"), worklog(bob, 2, 9, "TEST-1")]
+            ),
+            Issue(
+                key="TEST-2", summary="", issue_type="Bug", components=[backend],
+                labels=[], work_type=WorkType.DEVELOPMENT,
+                worklogs=[worklog(alice, 1, 10, "TEST-2"), worklog(alice, 3, 31, "TEST-2")]
+            ),
+        ]
+
+        entries = processor.process_issues(
+            issues, "TEST", datetime(2025, 1, 1), datetime(2025, 1, 31, 23, 59)
+        )
+
+        by_key = {(str(e.project_component), e.author.display_name): e for e in entries}
+        assert list(by_key) == [
+            ("TEST - Backend", "Alice"), ("TEST - Backend", "Bob"),
+            ("TEST - Frontend", "Alice"), ("TEST - Frontend", "Bob"),
+        ]
+        alice_backend = by_key[("TEST - Backend", "Alice")]
+        assert alice_backend.hours == 6.0
+        assert alice_backend.issues == ["TEST-1", "TEST-2"]
+        assert alice_backend.week_hours == {1: 2.0, 2: 1.0, 5: 3.0}
+        assert by_key[("TEST - Frontend", "Bob")].hours == 1.0
+
+    def test_filters_by_date_and_author(self, processor):
+        """Test worklogs outside the range or by other authors are skipped"""
+        alice = Author(email="alice@example.com", display_name="Alice")
+        bob = Author(email="bob@example.com", display_name="Bob")
+        issue = Issue(
+            key="TEST-1", summary="", issue_type="Task", components=[Component(name="Backend")],
+            labels=[], work_type=WorkType.MAINTENANCE,
+            worklogs=[
+                Worklog(id="1", author=alice, time_spent_seconds=3600,
+                        started=datetime(2025, 1, 15), issue_key="TEST-1"),
+                Worklog(id="2", author=alice, time_spent_seconds=3600,
+                        started=datetime(2025, 2, 1), issue_key="TEST-1"),
+                Worklog(id="3", author=bob, time_spent_seconds=3600,
+                        started=datetime(2025, 1, 16), issue_key="TEST-1"),
+            ]
+        )
+
+        entries = processor.process_issues(
+            [issue], "TEST", datetime(2025, 1, 1), datetime(2025, 1, 31), filter_author=alice
+        )
+
+        assert len(entries) == 1
+        assert entries[0].author == alice
+        assert entries[0].hours == 1.0
+        assert entries[0].work_type == WorkType.MAINTENANCE
+
+    def test_name_only_filter_matches_every_account(self, processor):
+        """Test an author filter without account_id keeps worklogs of every matching account"""
+        first = Author(email="alice@example.com", display_name="Alice", account_id="a1")
+        second = Author(email="alice@example.com", display_name="Alice", account_id="a2")
+        issue = Issue(
+            key="TEST-1", summary="", issue_type="Task", components=[Component(name="Backend")],
+            labels=[], work_type=WorkType.DEVELOPMENT,
+            worklogs=[
+                Worklog(id="1", author=first, time_spent_seconds=3600,
+                        started=datetime(2025, 1, 15), issue_key="TEST-1"),
+                Worklog(id="2", author=second, time_spent_seconds=7200,
+                        started=datetime(2025, 1, 16), issue_key="TEST-1"),
+            ]
+        )
+
+        entries = processor.process_issues(
+            [issue], "TEST", datetime(2025, 1, 1), datetime(2025, 1, 31),
+            filter_author=Author(email="alice@example.com", display_name="Alice")
+        )
+
+        assert sorted(e.author.account_id for e in entries) == ["a1", "a2"]
+        assert sum(e.hours for e in entries) == 3.0
+
+    def test_process_issues_by_month(self, processor):
+        """Test per-month processing matches processing each month's range"""
+        author = Author(email="alice@example.com", display_name="Alice")
+        issue = Issue(
+            key="TEST-1", summary="", issue_type="Task", components=[Component(name="Backend")],
+            labels=[], work_type=WorkType.DEVELOPMENT,
+            worklogs=[
+                Worklog(id=str(month), author=author, time_spent_seconds=3600 * month,
+                        started=datetime(2025, month, 10, tzinfo=timezone.utc), issue_key="TEST-1")
+                for month in (1, 3, 12)
+            ]
+        )
+
+        entries_by_month = processor.process_issues_by_month([issue], "TEST", 2025)
+
+        assert sorted(entries_by_month) == list(range(1, 13))
+        for month, entries in entries_by_month.items():
+            expected = processor.process_issues([issue], "TEST", *get_month_range(2025, month))
+            assert [(e.hours, e.week_hours) for e in entries] == [(e.hours, e.week_hours) for e in expected]
+        assert [e.hours for e in entries_by_month[12]] == [12.0]
+
+
+class TestGetCsvData:
+    """Test CSV data preparation"""
+
+    def test_get_csv_data(self, processor):
+        """Test hours are summed per project component and author"""
+        alice = Author(email="alice@example.com", display_name="Alice")
+        bob = Author(email="bob@example.com", display_name="Bob")
+        entries = [
+            make_entry(alice, 1.0, "TEST-1"),
+            make_entry(alice, 2.5, "TEST-2"),
+            make_entry(bob, 3.0, "TEST-3", component="Frontend"),
+        ]
+
+        csv_data = processor.get_csv_data(entries)
+
+        backend = ProjectComponent(project="TEST", component=Component(name="Backend"))
+        frontend = ProjectComponent(project="TEST", component=Component(name="Frontend"))
+        assert csv_data == {backend: {alice: 3.5}, frontend: {bob: 3.0}}
+
+    def test_get_csv_data_empty(self, processor):
+        """Test no entries gives no CSV data"""
+        assert processor.get_csv_data([]) == {}